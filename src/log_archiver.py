@@ -1,8 +1,13 @@
+import array
+import ctypes
+import errno
 import logging
 import os
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 import requests
 from kubernetes import client
@@ -28,12 +33,13 @@ def delete_old_logs(log_dir, max_age_minutes, logger):
             file_path = os.path.join(log_dir, filename)
             try:
                 # Get both creation and modification times
-                file_stats = os.stat(file_path)
+                file_stats = os.stat(file_path, follow_symlinks=False)
                 file_creation_time = datetime.fromtimestamp(file_stats.st_ctime, timezone.utc)
                 file_mod_time = datetime.fromtimestamp(file_stats.st_mtime, timezone.utc)
 
                 if file_creation_time < cutoff_time:
                     os.remove(file_path)
+                    stats_counter.remove(file_path)
                     logger.info(
                         f"Deleted old log file: {file_path}\n"
                         f"  Created: {file_creation_time}\n"
@@ -105,6 +111,18 @@ def get_pod_logs(v1, namespace, pod_name, container_name=None):
         return None
 
 
+def write_log_file(log_path, log_data):
+    """
+    Write archived log data to log_path and record it in the stats counter.
+    The size recorded is the number of bytes written and the creation time is taken right after the write,
+    so the counter is kept current without stat-ing the file.
+    """
+    data = log_data.encode("utf-8")
+    with open(log_path, "wb") as f:
+        f.write(data)
+    stats_counter.add(log_path, len(data), time.time())
+
+
 def archive_pod_logs(v1, namespace, pod_name, log_dir):
     """
     Archive logs for all containers and init containers in a pod.
@@ -125,8 +143,7 @@ def archive_pod_logs(v1, namespace, pod_name, log_dir):
                 log_path = os.path.join(log_dir, filename)
                 os.makedirs(os.path.dirname(log_path), exist_ok=True)
 
-                with open(log_path, "w") as f:
-                    f.write(log_data)
+                write_log_file(log_path, log_data)
                 logging.info(f"Archived logs for pod {pod_name} init container {container_name}")
 
         # Archive regular container logs
@@ -140,40 +157,352 @@ def archive_pod_logs(v1, namespace, pod_name, log_dir):
                 log_path = os.path.join(log_dir, filename)
                 os.makedirs(os.path.dirname(log_path), exist_ok=True)
 
-                with open(log_path, "w") as f:
-                    f.write(log_data)
+                write_log_file(log_path, log_data)
                 logging.info(f"Archived logs for pod {pod_name} container {container_name}")
     except ApiException as e:
         logging.error(f"Error archiving logs for pod {pod_name}: {e}")
 
 
-def get_log_dir_stats(log_dir):
+# --- Log Directory Scanning ---
+
+# Threads used to scan pod directories concurrently; metadata calls mostly wait on the filesystem, not the CPU
+LOG_DIR_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# statx(2) constants from <linux/fcntl.h> and <linux/stat.h>
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_SIZE = 0x200
+STATX_CTIME = 0x80
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_int64), ("tv_nsec", ctypes.c_uint32), ("reserved", ctypes.c_int32)]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("spare2", ctypes.c_uint64 * 16),  # Device numbers and reserved space, the struct is 256 bytes
+    ]
+
+
+def _load_statx():
+    """Return the C library's statx function, or None if it has none (not Linux, or glibc < 2.28)."""
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (AttributeError, OSError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+# Set to None on first ENOSYS/EPERM, after which os.stat is used
+_libc_statx = _load_statx()
+
+
+def stat_size_ctime(path, dir_fd=None):
     """
-    Get statistics about the log directory.
-    Returns a tuple of (total_size_bytes, file_count, oldest_date)
+    Return (st_size, st_ctime) of path without following symlinks.
+    Uses statx(2) with AT_STATX_DONT_SYNC and only the size and ctime in the mask where available, so network
+    filesystems may answer from cached attributes instead of revalidating with the server.
+    Falls back to os.stat when statx is unavailable.
     """
-    if not os.path.exists(log_dir):
-        return 0, 0, None
+    global _libc_statx
+    statx = _libc_statx
+    if statx is not None:
+        buf = _Statx()
+        wanted = STATX_SIZE | STATX_CTIME
+        flags = AT_SYMLINK_NOFOLLOW | AT_STATX_DONT_SYNC
+        if statx(AT_FDCWD if dir_fd is None else dir_fd, os.fsencode(path), flags, wanted, ctypes.byref(buf)) == 0:
+            if (buf.stx_mask & wanted) == wanted:
+                return buf.stx_size, buf.stx_ctime.tv_sec + buf.stx_ctime.tv_nsec / 1e9
+        else:
+            err = ctypes.get_errno()
+            if err not in (errno.ENOSYS, errno.EPERM):
+                raise OSError(err, os.strerror(err), path)
+            # The kernel or the container's seccomp profile does not allow statx
+            _libc_statx = None
+    file_stats = os.stat(path, dir_fd=dir_fd, follow_symlinks=False)
+    return file_stats.st_size, file_stats.st_ctime
+
+
+def iter_log_files(log_dir):
+    """
+    Recursively yield os.DirEntry objects for the regular .log files under log_dir, without following symlinks.
+    Uses os.scandir so file types come from the directory listing and entry.stat() is cached per entry,
+    instead of os.walk building full name lists and stat-ing every path again.
+    """
+    # Multi-container pods create subdirectories, so descend into directories with an explicit stack
+    stack = [log_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".log") and entry.is_file(follow_symlinks=False):
+                    yield entry
 
-    total_size = 0
-    file_count = 0
-    oldest_date = None
 
-    for filename in os.listdir(log_dir):
-        if filename.endswith(".log"):
-            file_path = os.path.join(log_dir, filename)
-            file_stats = os.stat(file_path)
+# Fds of log directories opened once at startup. Pod directories under them are opened relative to the fd,
+# so a scan does not resolve the log directory path from / again for every directory.
+# Key: log_dir, Value: dir fd
+_log_dir_fds = {}
+
+
+def open_log_dir(log_dir):
+    """
+    Open log_dir once and use its fd as the base for later scans and purges of it.
+    The fd keeps pointing at the original directory, so log_dir should not be replaced while the app runs
+    (it is normally a volume mount point).
+    """
+    if log_dir not in _log_dir_fds:
+        _log_dir_fds[log_dir] = os.open(log_dir, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+
+
+def _list_log_dir(log_dir, dir_path):
+    """
+    Open dir_path, a directory under log_dir, and list it without following symlinks.
+    Returns (dir_fd, names, subdirectory paths), where names are its regular .log files and the caller must close
+    dir_fd, or None if the directory was removed or replaced since it was listed.
+    """
+    root_fd = _log_dir_fds.get(log_dir)
+    try:
+        if root_fd is None:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        else:
+            # A fresh open file description, even for log_dir itself: concurrent scandir calls on one shared
+            # fd would share its read position
+            dir_fd = os.open(os.path.relpath(dir_path, log_dir), os.O_RDONLY | os.O_DIRECTORY, dir_fd=root_fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    names = []
+    subdirs = []
+    try:
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(os.path.join(dir_path, entry.name))
+                elif entry.name.endswith(".log") and entry.is_file(follow_symlinks=False):
+                    names.append(entry.name)
+    except BaseException:
+        os.close(dir_fd)
+        raise
+    return dir_fd, names, subdirs
+
+
+def iter_log_file_batches(log_dir):
+    """
+    Recursively yield (dir_path, dir_fd, names) for every directory under log_dir, where names are its regular
+    .log files. The directory fd is only valid until the next item is requested. Stat-ing names relative to it
+    resolves each directory once per batch instead of walking the full path again for every file.
+    """
+    stack = [log_dir]
+    while stack:
+        dir_path = stack.pop()
+        listing = _list_log_dir(log_dir, dir_path)
+        if listing is None:
+            continue
+        dir_fd, names, subdirs = listing
+        try:
+            stack.extend(subdirs)
+            if names:
+                yield dir_path, dir_fd, names
+        finally:
+            os.close(dir_fd)
+
+
+def _scan_log_dir(log_dir, dir_path):
+    """Stat the .log files directly in dir_path. Returns ([(path, size, ctime)], subdirectory paths)."""
+    listing = _list_log_dir(log_dir, dir_path)
+    if listing is None:
+        return [], []
+    dir_fd, names, subdirs = listing
+    file_stats = []
+    try:
+        for name in names:
+            try:
+                size, creation_time = stat_size_ctime(name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                continue  # Removed by the cleanup job or a purge since it was listed
+            file_stats.append((os.path.join(dir_path, name), size, creation_time))
+    finally:
+        os.close(dir_fd)
+    return file_stats, subdirs
+
+
+def iter_log_file_stats(log_dir, max_workers=LOG_DIR_SCAN_WORKERS):
+    """
+    Recursively yield (path, size, ctime) for the regular .log files under log_dir.
+    Each directory is scanned as its own task on a thread pool, so the listing and statx calls of different
+    pod directories overlap; ctypes and os release the GIL around the syscalls.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="LogDirScan") as pool:
+        pending = {pool.submit(_scan_log_dir, log_dir, log_dir)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_stats, subdirs = future.result()
+                pending.update(pool.submit(_scan_log_dir, log_dir, subdir) for subdir in subdirs)
+                yield from file_stats
 
-            # Update total size
-            total_size += file_stats.st_size
-            file_count += 1
 
-            # Update oldest date
-            creation_time = file_stats.st_ctime
-            if oldest_date is None or creation_time < oldest_date:
-                oldest_date = creation_time
+def _summarize_file_stats(file_stats):
+    """
+    Reduce a collection of (size, ctime) pairs to (total_size_bytes, file_count, oldest_date).
+    The pairs are copied into two contiguous typed arrays first and reduced with the builtin sum and min,
+    which loop in C instead of running the accumulator bytecode once per file.
+    """
+    sizes = array.array("q", map(itemgetter(0), file_stats))
+    creation_times = array.array("d", map(itemgetter(1), file_stats))
+    return sum(sizes), len(sizes), min(creation_times, default=None)
 
-    return total_size, file_count, oldest_date
+
+class StatsCounter:
+    """
+    Running size, count and oldest creation time of the archived log files.
+    The archiver and the cleanup paths report every file they write or delete, so the stats endpoint reads
+    the totals without rescanning the log directory. A periodic full scan reseeds the counter to pick up
+    changes made outside this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files = {}  # Key: file path, Value: (size, ctime)
+        self._total_size = 0
+        self._oldest = None  # None when there are no files or the oldest file was removed
+        self._seeded_at = None  # time.monotonic() of the last reseed
+
+    def reseed(self, file_stats):
+        """Replace the counter contents with an iterable of (path, size, ctime) from a full scan."""
+        files = {path: (size, ctime) for path, size, ctime in file_stats}
+        total_size, _, oldest = _summarize_file_stats(files.values())
+        with self._lock:
+            self._files = files
+            self._total_size = total_size
+            self._oldest = oldest
+            self._seeded_at = time.monotonic()
+
+    def add(self, path, size, ctime):
+        """Record a file that was written, replacing any earlier entry for the same path."""
+        with self._lock:
+            self._discard(path)
+            self._files[path] = (size, ctime)
+            self._total_size += size
+            if self._oldest is not None and ctime < self._oldest:
+                self._oldest = ctime
+
+    def remove(self, path):
+        """Record a file that was deleted."""
+        with self._lock:
+            self._discard(path)
+
+    def _discard(self, path):
+        """Drop path from the counter. Must be called with the lock held."""
+        previous = self._files.pop(path, None)
+        if previous is not None:
+            self._total_size -= previous[0]
+            if previous[1] == self._oldest:
+                self._oldest = None
+
+    def age(self):
+        """Seconds since the last reseed, or None if the counter was never seeded."""
+        seeded_at = self._seeded_at
+        return None if seeded_at is None else time.monotonic() - seeded_at
+
+    def snapshot(self):
+        """Return (total_size_bytes, file_count, oldest_date) of the counted log files."""
+        with self._lock:
+            if self._oldest is None and self._files:
+                # Only recomputed after the oldest file was removed or rewritten
+                _, _, self._oldest = _summarize_file_stats(self._files.values())
+            return self._total_size, len(self._files), self._oldest
+
+
+# Shared by the archiver, the cleanup job, the purge endpoint and the stats endpoint
+stats_counter = StatsCounter()
+
+# Rescans currently running, so concurrent callers wait for the same scan instead of starting their own
+# Key: log_dir, Value: concurrent.futures.Future of the snapshot
+_refreshes_in_flight = {}
+_refreshes_in_flight_lock = threading.Lock()
+
+
+def refresh_log_dir_stats(log_dir):
+    """
+    Rescan the log directory, reseed the stats counter and return its snapshot.
+    If a rescan of log_dir is already running, waits for it and returns its result instead.
+    """
+    with _refreshes_in_flight_lock:
+        future = _refreshes_in_flight.get(log_dir)
+        is_owner = future is None
+        if is_owner:
+            future = _refreshes_in_flight[log_dir] = Future()
+    if not is_owner:
+        return future.result()
+
+    try:
+        # Each file's creation time comes from the same statx call as its size, so it costs no extra syscall.
+        # Pod directory ctimes are not a substitute: the archiver rewrites existing files in place, which moves
+        # the file's ctime but not its directory's, so the oldest directory can predate every file it still holds.
+        stats_counter.reseed(iter_log_file_stats(log_dir) if os.path.exists(log_dir) else ())
+        snapshot = stats_counter.snapshot()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(snapshot)
+        return snapshot
+    finally:
+        with _refreshes_in_flight_lock:
+            del _refreshes_in_flight[log_dir]
+
+
+def get_cached_log_dir_stats(log_dir, max_age_seconds):
+    """
+    Return the log directory statistics from the stats counter.
+    Falls back to a synchronous rescan if the counter was never seeded or was last reseeded
+    more than max_age_seconds ago.
+    """
+    age = stats_counter.age()
+    if age is None or age > max_age_seconds:
+        return refresh_log_dir_stats(log_dir)
+    return stats_counter.snapshot()
+
+
+def start_log_dir_stats_refresher(log_dir, interval_seconds, logger):
+    """
+    Starts a daemon thread that reseeds the stats counter from a full scan every interval_seconds.
+    """
+
+    def job():
+        while True:
+            try:
+                refresh_log_dir_stats(log_dir)
+            except Exception as e:
+                logger.error(f"Unhandled exception in log directory stats refresher: {e}", exc_info=True)
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=job, daemon=True)
+    thread.name = "LogDirStatsThread"
+    thread.start()
+    logger.info(f"Log directory stats refresher started. Will run every {interval_seconds} seconds.")
 
 
 def watch_pods_and_archive(namespace, v1, log_dir, logger):
@@ -184,8 +513,10 @@ def watch_pods_and_archive(namespace, v1, log_dir, logger):
 
     while True:
         try:
-            # Get all pods in the namespace
-            pod_list = v1.list_namespaced_pod(namespace=namespace)
+            # Get all pods in the namespace. resource_version="0" serves the list from the apiserver watch cache
+            # instead of a quorum read from etcd; a slightly stale list is picked up on the next pass
+            # (see https://github.com/kubernetes/kubernetes/issues/102672).
+            pod_list = v1.list_namespaced_pod(namespace=namespace, resource_version="0")
 
             # Archive logs for each pod
             for pod in pod_list.items:
@@ -230,6 +561,8 @@ def purge_previous_pod_logs(log_dir, logger):
     try:
         v1 = client.CoreV1Api()
         namespace = os.environ.get("K8S_NAMESPACE", "default")
+        # Purging deletes the logs of pods missing from this list, so it needs a consistent (quorum) read,
+        # not the possibly stale watch cache used by the other pod lists.
         pod_list = v1.list_namespaced_pod(namespace=namespace)
         current_pod_containers = set()
 
@@ -250,28 +583,27 @@ def purge_previous_pod_logs(log_dir, logger):
         logger.error(f"Error getting current pod list: {e}")
         return 0, 1
 
-    # Use os.walk to search subdirectories since multi-container pods create subdirectories
-    for root, _, files in os.walk(log_dir):
-        for filename in files:
-            if filename.endswith(".log"):  # Process only .log files
-                file_path = os.path.join(root, filename)
-                try:
-                    # Get relative path from log_dir to construct pod/container name
-                    relative_path = os.path.relpath(file_path, log_dir)
-                    # Remove .log extension to get pod/container name
-                    pod_container = relative_path[:-4]
-
-                    # Only delete if this pod/container is not in the current pod list
-                    if pod_container not in current_pod_containers:
-                        os.remove(file_path)
-                        logger.info(f"Purged previous pod log file: {file_path}")
-                        deleted_count += 1
-                except OSError as e:
-                    logger.error(f"Error purging file {file_path}: {e}")
-                    error_count += 1
-                except Exception as e:
-                    logger.error(f"Unexpected error processing file {file_path}: {e}")
-                    error_count += 1
+    # Multi-container pods create subdirectories. Each directory is opened once and its files are unlinked
+    # relative to that fd (unlinkat), so every delete is a single-component lookup instead of a full path walk.
+    for dir_path, dir_fd, names in iter_log_file_batches(log_dir):
+        for filename in names:
+            file_path = os.path.join(dir_path, filename)
+            try:
+                # Get relative path from log_dir and remove the .log extension to get pod/container name
+                pod_container = os.path.relpath(file_path, log_dir)[:-4]
+
+                # Only delete if this pod/container is not in the current pod list
+                if pod_container not in current_pod_containers:
+                    os.unlink(filename, dir_fd=dir_fd)
+                    stats_counter.remove(file_path)
+                    logger.info(f"Purged previous pod log file: {file_path}")
+                    deleted_count += 1
+            except OSError as e:
+                logger.error(f"Error purging file {file_path}: {e}")
+                error_count += 1
+            except Exception as e:
+                logger.error(f"Unexpected error processing file {file_path}: {e}")
+                error_count += 1
 
     logger.info(f"Previous pod logs purge finished. Deleted: {deleted_count}, Errors: {error_count}")
     return deleted_count, error_count
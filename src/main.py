@@ -1,18 +1,27 @@
+import codecs
+import collections
+import hashlib
+import heapq
 import json
 import logging
+import mmap
 import os
 import re
 import tempfile
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from html import escape
 from typing import Any, Dict, List, Optional
 
+import orjson
 from flask import (
     Flask,
+    Response,
     jsonify,
     redirect,
     render_template_string,
@@ -20,18 +29,57 @@ from flask import (
     send_file,
     send_from_directory,
     session,
+    stream_with_context,
 )
-from kubernetes import client, config
+from flask.json.provider import DefaultJSONProvider
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from urllib3.util import Retry
 
 # --- Version Configuration ---
 __version__ = "0.8.2"
 
 # --- Log Archiver Imports ---
-from log_archiver import get_log_dir_stats, start_log_cleanup_job, watch_pods_and_archive
+from log_archiver import (
+    get_cached_log_dir_stats,
+    iter_log_files,
+    open_log_dir,
+    start_log_cleanup_job,
+    start_log_dir_stats_refresher,
+    watch_pods_and_archive,
+)
 
 # --- Flask App Setup ---
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes and parses with orjson, which encodes straight to bytes and is several times
+    faster than the stdlib json module on payloads made of many small dicts, such as log entries.
+    Types orjson does not handle natively fall back to Flask's default conversions.
+    """
+
+    # Let dates fall through to Flask's default so they serialize as HTTP dates, as with the stdlib provider
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        option = self.option | orjson.OPT_INDENT_2 if kwargs.get("indent") else self.option
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson.JSONDecodeError subclasses ValueError, so request.get_json still turns bad input into a 400
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype)
+
+
 app = Flask(__name__, static_folder=".", static_url_path="")  # Serve static files from current dir
+app.json = ORJSONProvider(app)
 
 # --- Logging Configuration ---
 # Basic logging to see Flask and K8s client interactions
@@ -75,7 +123,15 @@ except config.ConfigException:
         # For a real app, you might want to prevent startup or have a clear error state.
         # Here, we'll let it proceed, and API calls will fail if K8s client isn't configured.
 
-v1 = client.CoreV1Api()  # Kubernetes CoreV1API client
+# Every Kubernetes call shares one ApiClient. Its urllib3 pool is sized for the concurrent log fetches, watches and
+# request threads, so connections are kept alive and reused instead of serializing on the default pool of 4.
+KUBE_API_POOL_MAXSIZE = int(os.environ.get("KUBE_API_POOL_MAXSIZE", "64"))
+kube_configuration = client.Configuration.get_default_copy()
+kube_configuration.connection_pool_maxsize = KUBE_API_POOL_MAXSIZE
+# Retry connection-level failures, such as a kept-alive connection closed by the apiserver, as often as the
+# client's urllib3 default of 3 but with a short backoff between attempts
+kube_configuration.retries = Retry(total=3, backoff_factor=0.1)
+v1 = client.CoreV1Api(api_client=client.ApiClient(configuration=kube_configuration))  # Kubernetes CoreV1API client
 
 
 # --- Kubernetes Events Classes ---
@@ -133,6 +189,120 @@ class KubernetesEvent:
         }
 
 
+# --- Pod Cache ---
+class PodCache:
+    """
+    Informer-style cache of the pods in a namespace, keyed by pod name.
+
+    A daemon thread lists the pods once and then keeps the cache current from a watch stream
+    (ADDED/MODIFIED/DELETED events), so request handlers can read the pod list without calling
+    the kube-apiserver. When the watch's resource version expires (HTTP 410) the cache re-lists.
+    The cache stops reporting itself as synced while a re-list is failing, so callers fall back to
+    the apiserver instead of serving a pod list that can no longer be refreshed.
+    """
+
+    def __init__(self, v1_api, namespace, logger, watch_timeout_seconds=300, retry_delay_seconds=5):
+        self._v1 = v1_api
+        self._namespace = namespace
+        self._logger = logger
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._retry_delay_seconds = retry_delay_seconds
+        self._lock = threading.RLock()
+        self._pods = {}  # pod name -> V1Pod
+        self._containers = {}  # pod name -> (pod_name, containers, init_containers)
+        self._synced = threading.Event()
+
+    def start(self):
+        """Start the background list/watch thread."""
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.name = "PodCacheThread"
+        thread.start()
+        self._logger.info(f"Pod cache thread started for namespace {self._namespace}.")
+
+    def is_synced(self):
+        """Return True once the cache holds a complete pod list."""
+        return self._synced.is_set()
+
+    def snapshot_pods(self):
+        """Return a list of the cached V1Pod objects."""
+        with self._lock:
+            return list(self._pods.values())
+
+    def snapshot_pod_names(self):
+        """Return a list of the cached pod names."""
+        with self._lock:
+            return list(self._pods)
+
+    def snapshot_containers(self):
+        """Return a list of (pod_name, containers, init_containers) tuples for the cached pods."""
+        with self._lock:
+            return list(self._containers.values())
+
+    def _store(self, pod):
+        pod_name = pod.metadata.name
+        self._pods[pod_name] = pod
+        self._containers[pod_name] = (
+            pod_name,
+            [container.name for container in (pod.spec.containers or [])],
+            [container.name for container in (pod.spec.init_containers or [])],
+        )
+
+    def _relist(self):
+        """Replace the cache contents with a fresh pod list and return its resource version."""
+        # resource_version="0" lets the apiserver answer from its watch cache instead of a quorum read from etcd
+        # (see https://github.com/kubernetes/kubernetes/issues/102672).
+        try:
+            pod_list = self._v1.list_namespaced_pod(namespace=self._namespace, resource_version="0")
+        except Exception:
+            self._synced.clear()
+            raise
+        with self._lock:
+            self._pods = {}
+            self._containers = {}
+            for pod in pod_list.items:
+                self._store(pod)
+        self._synced.set()
+        return pod_list.metadata.resource_version
+
+    def _apply_event(self, event_type, pod):
+        with self._lock:
+            if event_type == "DELETED":
+                self._pods.pop(pod.metadata.name, None)
+                self._containers.pop(pod.metadata.name, None)
+            elif event_type in ("ADDED", "MODIFIED"):
+                self._store(pod)
+
+    def _run(self):
+        resource_version = None
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                pod_watch = watch.Watch()
+                for event in pod_watch.stream(
+                    self._v1.list_namespaced_pod,
+                    namespace=self._namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self._watch_timeout_seconds,
+                    # Client-side read timeout, so a half-open connection cannot block the stream forever
+                    _request_timeout=self._watch_timeout_seconds + 30,
+                ):
+                    pod = event["object"]
+                    self._apply_event(event["type"], pod)
+                    resource_version = pod.metadata.resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    self._logger.info("Pod cache watch expired, re-listing pods.")
+                else:
+                    self._logger.warning(f"Pod cache watch failed: {e.status} - {e.reason}")
+                    time.sleep(self._retry_delay_seconds)
+                resource_version = None
+            except Exception as e:
+                self._logger.error(f"Unexpected error in pod cache watch: {e}")
+                resource_version = None
+                time.sleep(self._retry_delay_seconds)
+
+
 # Determine Kubernetes Namespace
 # Reads from 'K8S_NAMESPACE' environment variable, defaults to 'default'.
 KUBE_NAMESPACE = os.environ.get("K8S_NAMESPACE", "default")
@@ -144,6 +314,10 @@ RETAIN_ALL_POD_LOGS = os.environ.get("RETAIN_ALL_POD_LOGS", "false").lower() ==
 MAX_LOG_RETENTION_MINUTES = int(os.environ.get("MAX_LOG_RETENTION_MINUTES", "10080"))  # Default 7 days
 ALLOW_PREVIOUS_LOG_PURGE = os.environ.get("ALLOW_PREVIOUS_LOG_PURGE", "true").lower() == "true"
 LOG_DIR = "/logs"
+# /api/logDirStats is answered from a counter the archiver and cleanup jobs keep up to date, reseeded by a
+# background rescan every LOG_DIR_STATS_TTL_SECONDS; a request only rescans the directory itself if the
+# last reseed is more than twice that old
+LOG_DIR_STATS_TTL_SECONDS = int(os.environ.get("LOG_DIR_STATS_TTL_SECONDS", "30"))
 
 if RETAIN_ALL_POD_LOGS:
     if not os.path.exists(LOG_DIR):
@@ -157,14 +331,59 @@ if RETAIN_ALL_POD_LOGS:
 
 app.logger.info(f"Targeting Kubernetes namespace: {KUBE_NAMESPACE}")
 
+# --- Log Fetch Configuration ---
+# Per-container log fetches for the all-pods view are network-bound, so they run concurrently on a shared,
+# bounded pool. The pool size also caps the number of concurrent log requests against the kube-apiserver.
+LOG_FETCH_WORKERS = int(os.environ.get("LOG_FETCH_WORKERS", "16"))
+LOG_FETCH_POOL = ThreadPoolExecutor(max_workers=LOG_FETCH_WORKERS, thread_name_prefix="LogFetch")
+# Log bodies are streamed from the kube-apiserver and split into lines in chunks of this size
+LOG_STREAM_CHUNK_BYTES = 64 * 1024
+# Number of log entries serialized per chunk of a format=ndjson response
+NDJSON_BATCH_LINES = 500
+# Searches with a tail_lines limit only look at the newest max(tail_lines, 1000) * SEARCH_WINDOW_MULTIPLIER lines
+# of each container instead of its whole log
+SEARCH_WINDOW_MULTIPLIER = int(os.environ.get("SEARCH_WINDOW_MULTIPLIER", "10"))
+
+# --- Response Cache Configuration ---
+# Pod topology changes at a seconds-to-minutes cadence, so UI polling of /api/pods and /api/archived_pods
+# is answered from a short-lived in-process cache instead of being rebuilt on every request.
+RESPONSE_CACHE_TTL_SECONDS = int(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", "5"))
+_pods_cache = {}  # Key: exclude_self, Value: {"ts": float, "body": bytes, "etag": str}
+_pods_cache_lock = threading.Lock()
+_archived_files_cache = {"ts": 0.0, "mtime_ns": None, "files": []}
+_archived_files_cache_lock = threading.Lock()
+
+# --- Archived Log Cache Configuration ---
+# Archived log files only change when the archiver rewrites them, so their parsed entries are kept in an LRU
+# cache keyed by (path, mtime_ns, size) and repeated views and searches of the same file skip the read and parse.
+ARCHIVED_LOG_CACHE_MAX_FILES = int(os.environ.get("ARCHIVED_LOG_CACHE_MAX_FILES", "64"))
+# Upper bound on the estimated memory held by the cache; a file whose parsed entries would exceed it is never
+# cached. Keep it well below the pod memory limit.
+ARCHIVED_LOG_CACHE_MAX_BYTES = int(os.environ.get("ARCHIVED_LOG_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Per-line memory overhead on top of the line's own bytes, measured with tracemalloc: a parsed entry (dict,
+# timestamp and message strings) costs about 290 bytes more than its line
+ARCHIVED_ENTRY_OVERHEAD_BYTES = 320
+# Archived files larger than this are never loaded whole: they are streamed with _scan_archived_log_file, which
+# keeps only the returned entries, and are not cached
+ARCHIVED_LOG_SCAN_MIN_BYTES = int(os.environ.get("ARCHIVED_LOG_SCAN_MIN_BYTES", str(4 * 1024 * 1024)))
+# Key: (path, mtime_ns, size), Value: {"entries", "cost"} where cost is the estimated memory in bytes
+_archived_log_cache = collections.OrderedDict()
+_archived_log_cache_lock = threading.Lock()
+
 app.secret_key = os.urandom(24)  # Required for session
 
 # --- Start Background Jobs (if applicable) ---
+# The pod cache replaces per-request pod list calls against the kube-apiserver. It is started with the server
+# below; until it has synced, handlers list pods from the apiserver directly.
+pod_cache = PodCache(v1, KUBE_NAMESPACE, app.logger)
+
 if RETAIN_ALL_POD_LOGS:
+    # Open LOG_DIR once so the stats scans and purges look up pod directories relative to it
+    open_log_dir(LOG_DIR)
     # Start the previous pod logs cleanup job
-    import threading
-
     start_log_cleanup_job(LOG_DIR, MAX_LOG_RETENTION_MINUTES, app.logger)
+    # Periodically reseed the log directory stats counter behind /api/logDirStats
+    start_log_dir_stats_refresher(LOG_DIR, LOG_DIR_STATS_TTL_SECONDS, app.logger)
     # Start the pod watcher and previous pod logs archiver job
     app.logger.info("Previous pod logs enabled. Starting pod watcher...")
     watch_thread = threading.Thread(
@@ -231,6 +450,24 @@ def login():
 
 
 # --- Helper Functions ---
+def _make_json_cache_entry(payload):
+    """Serialize a JSON payload once so it can be served repeatedly from a response cache."""
+    body = jsonify(payload).get_data()
+    return {"ts": time.monotonic(), "body": body, "etag": hashlib.sha1(body).hexdigest()}
+
+
+def _cached_json_response(cache_entry, max_age):
+    """
+    Build a JSON response from a cache entry with an ETag and Cache-Control header.
+    Returns 304 Not Modified when the client already holds the same payload.
+    """
+    response = app.response_class(cache_entry["body"], mimetype="application/json")
+    response.set_etag(cache_entry["etag"])
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
 def get_pod_health_status(pod):
     """
     Determine the health status of a pod based on its phase and container statuses.
@@ -308,6 +545,11 @@ def get_last_log_timestamp(pod_name, container_name=None):
         return None
 
 
+# ANSI escape sequence pattern
+# Matches: ESC[ followed by parameter bytes (0x30-0x3F), then intermediate bytes (0x20-0x2F), then final byte (0x40-0x7E)
+ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
 def strip_ansi_codes(text):
     """
     Remove ANSI escape sequences from text.
@@ -315,10 +557,7 @@ def strip_ansi_codes(text):
     """
     if text is None:
         return None
-    # ANSI escape sequence pattern
-    # Matches: ESC[ followed by parameter bytes (0x30-0x3F), then intermediate bytes (0x20-0x2F), then final byte (0x40-0x7E)
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE_RE.sub("", text)
 
 
 def convert_ansi_to_html(text):
@@ -362,6 +601,10 @@ def convert_ansi_to_html(text):
     return text
 
 
+# Appended by sanitize_log_message to messages it truncates
+TRUNCATION_MARKER = " [... truncated]"
+
+
 def sanitize_log_message(message, strip_ansi=True, max_length=10000):
     """
     Sanitize log message by removing/converting ANSI codes and limiting length.
@@ -379,7 +622,7 @@ def sanitize_log_message(message, strip_ansi=True, max_length=10000):
 
     # Truncate extremely long messages to prevent memory issues
     if len(message) > max_length:
-        message = message[:max_length] + " [... truncated]"
+        message = message[:max_length] + TRUNCATION_MARKER
 
     # Handle ANSI codes
     if strip_ansi:
@@ -516,6 +759,22 @@ def create_error_log_entry(pod_name, container_name, error_message, error_type="
     }
 
 
+# RFC3339Nano timestamp (YYYY-MM-DDTHH:MM:SS.sssssssssZ) as prefixed to log lines by the kubelet.
+# The (?:\.\d{1,9})? part handles optional fractional seconds.
+TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{1,9})?Z")
+
+
+def log_sort_key(entry):
+    """
+    Sort key that orders log entries chronologically, with entries without a timestamp first.
+    RFC3339Nano drops trailing zeros from the fractional seconds, so the raw strings misorder timestamps within
+    the same second ("03Z" > "03.5Z" and "03.5Z" > "03.55Z" because "Z" sorts after "." and the digits).
+    Without the trailing "Z" a shorter fraction is a prefix of a longer one and plain string comparison is correct.
+    """
+    timestamp = entry["timestamp"]
+    return timestamp[:-1] if timestamp else ""
+
+
 def parse_log_line(line_str, strip_ansi=True):
     """
     Parses a log line that typically starts with an RFC3339Nano timestamp.
@@ -527,19 +786,20 @@ def parse_log_line(line_str, strip_ansi=True):
         line_str: Raw log line string
         strip_ansi: If True, remove ANSI codes from message
     """
-    # Regex to capture RFC3339Nano timestamp (YYYY-MM-DDTHH:MM:SS.sssssssssZ)
-    # and the rest of the line as the message.
-    # The (\.\d+)? part handles optional fractional seconds.
-    match = re.match(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,9})?Z)\s(.*)", line_str)
-    if match:
-        timestamp_str = match.group(1)
-        message_str = match.group(3).strip()  # Get the message part and strip any trailing whitespace
-        message_str = sanitize_log_message(message_str, strip_ansi=strip_ansi)
-        return {"timestamp": timestamp_str, "message": message_str}
-    else:
-        # If no timestamp is found at the beginning, return the whole line as the message.
-        sanitized_line = sanitize_log_message(line_str.strip(), strip_ansi=strip_ansi)
-        return {"timestamp": None, "message": sanitized_line}
+    # The timestamp prefix has a fixed shape, so cheap fixed-position checks reject most lines without one
+    # before the regex runs, and the regex only ever scans the short prefix instead of the whole line.
+    if line_str[10:11] == "T" and line_str[4:5] == "-":
+        match = TIMESTAMP_RE.match(line_str)
+        if match:
+            end = match.end()
+            if line_str[end : end + 1].isspace():
+                message_str = line_str[end + 1 :].strip()  # Strip any trailing whitespace from the message
+                message_str = sanitize_log_message(message_str, strip_ansi=strip_ansi)
+                return {"timestamp": match.group(), "message": message_str}
+
+    # If no timestamp is found at the beginning, return the whole line as the message.
+    sanitized_line = sanitize_log_message(line_str.strip(), strip_ansi=strip_ansi)
+    return {"timestamp": None, "message": sanitized_line}
 
 
 # --- Routes ---
@@ -556,8 +816,36 @@ def serve_index():
 
 @retry_k8s_operation(max_retries=2, initial_delay=0.3)
 def _list_pods_with_retry():
-    """Helper function to list pods with retry logic."""
-    return v1.list_namespaced_pod(namespace=KUBE_NAMESPACE)
+    """
+    Helper function to list pods with retry logic.
+    resource_version="0" serves the list from the apiserver watch cache instead of a quorum read from etcd. The list
+    may be slightly stale, which is fine for a UI view (see https://github.com/kubernetes/kubernetes/issues/102672).
+    """
+    return v1.list_namespaced_pod(namespace=KUBE_NAMESPACE, resource_version="0")
+
+
+def _list_pods():
+    """
+    Return the pods in the configured namespace.
+    Served from the pod cache once it has synced; until then the kube-apiserver is queried directly.
+    """
+    if pod_cache.is_synced():
+        return pod_cache.snapshot_pods()
+    return _list_pods_with_retry().items
+
+
+def _list_pod_containers():
+    """Return (pod_name, containers, init_containers) tuples for the pods in the configured namespace."""
+    if pod_cache.is_synced():
+        return pod_cache.snapshot_containers()
+    return [
+        (
+            pod.metadata.name,
+            [container.name for container in pod.spec.containers],
+            [container.name for container in (pod.spec.init_containers or [])],
+        )
+        for pod in _list_pods_with_retry().items
+    ]
 
 
 @retry_k8s_operation(max_retries=2, initial_delay=0.3)
@@ -570,10 +858,271 @@ def _fetch_pod_logs_with_retry(pod_name, container_name=None, tail_lines=None):
         timestamps=True,
         tail_lines=tail_lines,
         follow=False,
-        _preload_content=True,
+        _preload_content=False,
+    )
+
+
+def iter_log_lines(response, chunk_size=LOG_STREAM_CHUNK_BYTES, prefilter=None):
+    """
+    Yield the lines of a streamed (_preload_content=False) log response without holding the whole body in memory.
+    The connection is released back to the pool once the stream has been consumed.
+    If prefilter is given (see build_search_prefilter), blocks of lines it rejects are skipped without being split.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    try:
+        for chunk in response.stream(chunk_size, decode_content=True):
+            text = pending + decoder.decode(chunk)
+            # Only split up to the last newline, the remainder may be the start of a line in the next chunk
+            cut = text.rfind("\n") + 1
+            pending = text[cut:]
+            block = text[:cut]
+            if prefilter is None or prefilter(block):
+                yield from block.splitlines()
+        pending += decoder.decode(b"", final=True)
+        if prefilter is None or prefilter(pending):
+            yield from pending.splitlines()
+    finally:
+        response.release_conn()
+
+
+@lru_cache(maxsize=256)
+def build_search_matcher(search_string, case_sensitive):
+    """
+    Build a predicate that tests whether a log message contains search_string.
+    Case-insensitive matching uses a compiled IGNORECASE pattern so messages don't need to be lower-cased
+    (and copied) one by one. Returns None when there is nothing to search for.
+    Memoized, since polling clients and the all-pods fan-out repeat the same search many times.
+    """
+    if not search_string:
+        return None
+    if case_sensitive:
+        return lambda message: search_string in message
+    return re.compile(re.escape(search_string), re.IGNORECASE).search
+
+
+def search_can_match_truncation_marker(search_string, case_sensitive):
+    """
+    Check whether search_string could match a message only because of the marker sanitize_log_message appends
+    to truncated messages, i.e. it lies within the marker or ends with a prefix of it.
+    Raw log text is then no longer a superset of the messages and cannot be used to rule out matches.
+    """
+    needle = search_string if case_sensitive else search_string.lower()
+    return needle in TRUNCATION_MARKER or any(
+        needle.endswith(TRUNCATION_MARKER[:i]) for i in range(1, len(TRUNCATION_MARKER) + 1)
     )
 
 
+@lru_cache(maxsize=256)
+def build_search_prefilter(search_string, case_sensitive):
+    """
+    Build a predicate for blocks of raw log text that is false only when no line in the block can match the search,
+    so iter_log_lines can drop whole blocks after one scan in C instead of parsing every line.
+    Blocks containing ESC always pass because removing ANSI codes can join a match.
+    Returns None when there is nothing to search for or the search could match the truncation marker.
+    """
+    if not search_string or search_can_match_truncation_marker(search_string, case_sensitive):
+        return None
+    if case_sensitive:
+        return lambda text: search_string in text or "\x1b" in text
+    pattern_search = re.compile(re.escape(search_string), re.IGNORECASE).search
+    if not search_string.isascii():
+        return lambda text: "\x1b" in text or pattern_search(text) is not None
+    # On ASCII text an IGNORECASE match is the same as a substring of the lower-cased text, which scans much faster
+    search_lower = search_string.lower()
+    return lambda text: (
+        "\x1b" in text or (search_lower in text.lower() if text.isascii() else pattern_search(text) is not None)
+    )
+
+
+def iter_processed_log_lines(lines, pod_name, container_name, search_string, case_sensitive):
+    """
+    Lazily parse and search-filter log lines, adding pod and container information to each entry.
+
+    Args:
+        lines: Iterable of raw log lines
+        pod_name: Pod name added to each entry
+        container_name: Container name added to each entry (optional)
+        search_string: Only yield entries whose message contains this string (optional)
+        case_sensitive: Whether the search is case-sensitive
+
+    Yields:
+        dict: Log entries in the order they were read
+    """
+    # This loop runs once per log line, so everything invariant is computed up front and
+    # looked-up names are bound to locals.
+    matches_search = build_search_matcher(search_string, case_sensitive)
+    # The raw line is checked before parsing so lines that cannot match never pay for parse_log_line,
+    # the message is still checked afterwards (the match may only be in the timestamp).
+    may_match = build_search_prefilter(search_string, case_sensitive)
+    source_fields = (
+        {"pod_name": pod_name, "container_name": container_name} if container_name else {"pod_name": pod_name}
+    )
+    parse = parse_log_line
+    for line_str in lines:
+        if not line_str:
+            continue
+        if may_match and not may_match(line_str):
+            continue
+        log_entry = parse(line_str)
+        if matches_search and not matches_search(log_entry["message"]):
+            continue
+        log_entry.update(source_fields)
+        yield log_entry
+
+
+def process_log_lines(lines, pod_name, container_name, search_string, case_sensitive, tail_lines):
+    """
+    Parse and search-filter log lines, adding pod and container information to each entry.
+
+    Args:
+        lines: Iterable of raw log lines
+        pod_name: Pod name added to each entry
+        container_name: Container name added to each entry (optional)
+        search_string: Only keep entries whose message contains this string (optional)
+        case_sensitive: Whether the search is case-sensitive
+        tail_lines: Only keep the last tail_lines matching entries, None or 0 keeps all
+
+    Returns:
+        list: Log entries in the order they were read
+    """
+    entries = iter_processed_log_lines(lines, pod_name, container_name, search_string, case_sensitive)
+    if not tail_lines:
+        return list(entries)
+    # Log lines arrive oldest first, so a bounded deque keeps exactly the newest tail_lines entries
+    # without ever holding more than that in memory.
+    return list(collections.deque(entries, maxlen=tail_lines))
+
+
+def ndjson_response(entries):
+    """
+    Stream log entries as newline-delimited JSON (application/x-ndjson).
+    Entries are serialized as they are consumed, so a lazy iterable is sent without first being
+    collected into a list and serialized as a single document.
+    """
+
+    def generate():
+        dumps = orjson.dumps
+        batch = []
+        for entry in entries:
+            batch.append(dumps(entry, default=app.json.default, option=orjson.OPT_APPEND_NEWLINE))
+            # Batch entries so each write to the client carries many lines
+            if len(batch) >= NDJSON_BATCH_LINES:
+                yield b"".join(batch)
+                batch = []
+        if batch:
+            yield b"".join(batch)
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _build_pods_payload(exclude_self):
+    """Build the /api/pods response payload from the current pod list."""
+    pod_info = []
+    last_log_time_futures = []
+
+    for pod in _list_pods():
+        if exclude_self and pod.metadata.name == KUBE_POD_NAME:
+            continue
+
+        pod_name = pod.metadata.name
+        containers = [container.name for container in pod.spec.containers]
+        init_containers = [container.name for container in (pod.spec.init_containers or [])]
+
+        # Get pod health status
+        health_info = get_pod_health_status(pod)
+
+        # Get pod metadata
+        created_time = pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None
+
+        # Process init containers with "init-" prefix
+        for init_container in init_containers:
+            container_id = f"{pod_name}/init-{init_container}"
+            last_log_time_futures.append(
+                LOG_FETCH_POOL.submit(get_last_log_timestamp, pod_name, f"init-{init_container}")
+            )
+
+            pod_info.append(
+                {
+                    "id": container_id,
+                    "pod_name": pod_name,
+                    "container_name": f"init-{init_container}",
+                    "type": "init_container",
+                    "health_status": health_info["status"],
+                    "health_reason": health_info["reason"],
+                    "last_log_time": None,
+                    "created_time": created_time,
+                }
+            )
+
+        # Process regular containers (always use pod/container format)
+        for container in containers:
+            container_id = f"{pod_name}/{container}"
+            last_log_time_futures.append(LOG_FETCH_POOL.submit(get_last_log_timestamp, pod_name, container))
+
+            pod_info.append(
+                {
+                    "id": container_id,
+                    "pod_name": pod_name,
+                    "container_name": container,
+                    "type": "container",
+                    "health_status": health_info["status"],
+                    "health_reason": health_info["reason"],
+                    "last_log_time": None,
+                    "created_time": created_time,
+                }
+            )
+
+    # Each last log timestamp is a separate kube-apiserver round-trip, so they are fetched concurrently
+    for container_info, future in zip(pod_info, last_log_time_futures):
+        container_info["last_log_time"] = future.result()
+
+    app.logger.info(f"Found {len(pod_info)} pod/container combinations in namespace '{KUBE_NAMESPACE}'")
+    return {
+        "namespace": KUBE_NAMESPACE,
+        "pods": pod_info,
+        "current_pod": KUBE_POD_NAME,
+    }
+
+
+def _fetch_container_logs(
+    pod_name, container_name, is_init, k8s_tail_lines, tail_lines, search_string, case_sensitive
+):
+    """
+    Fetch, parse and filter the logs of one container for the all-pods view.
+    Runs on LOG_FETCH_POOL. API errors are returned as an error log entry instead of being raised.
+    """
+    display_container_name = f"init-{container_name}" if is_init else container_name
+    logs = []
+    try:
+        log_response = _fetch_pod_logs_with_retry(
+            pod_name=pod_name, container_name=container_name, tail_lines=k8s_tail_lines
+        )
+        logs = process_log_lines(
+            iter_log_lines(log_response, prefilter=build_search_prefilter(search_string, case_sensitive)),
+            pod_name,
+            display_container_name,
+            search_string,
+            case_sensitive,
+            tail_lines,
+        )
+    except ApiException as e:
+        container_kind = "init container" if is_init else "container"
+        app.logger.warning(
+            f"Could not fetch logs for pod {pod_name} {container_kind} {container_name}: {e.status} - {e.reason}"
+        )
+        error_message, _ = format_k8s_error(e)
+        logs.append(
+            create_error_log_entry(
+                pod_name=pod_name,
+                container_name=display_container_name,
+                error_message=error_message,
+                error_type="log_fetch_error",
+            )
+        )
+    return logs
+
+
 @app.route("/api/pods", methods=["GET"])
 def get_pods():
     """
@@ -587,67 +1136,14 @@ def get_pods():
     exclude_self = request.args.get("exclude_self", "").lower() == "true"
 
     try:
-        pod_list_response = _list_pods_with_retry()
-        pod_info = []
-
-        for pod in pod_list_response.items:
-            if exclude_self and pod.metadata.name == KUBE_POD_NAME:
-                continue
-
-            pod_name = pod.metadata.name
-            containers = [container.name for container in pod.spec.containers]
-            init_containers = [container.name for container in (pod.spec.init_containers or [])]
-
-            # Get pod health status
-            health_info = get_pod_health_status(pod)
-
-            # Get pod metadata
-            created_time = pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None
-
-            # Process init containers with "init-" prefix
-            for init_container in init_containers:
-                container_id = f"{pod_name}/init-{init_container}"
-                last_log_time = get_last_log_timestamp(pod_name, f"init-{init_container}")
-
-                pod_info.append(
-                    {
-                        "id": container_id,
-                        "pod_name": pod_name,
-                        "container_name": f"init-{init_container}",
-                        "type": "init_container",
-                        "health_status": health_info["status"],
-                        "health_reason": health_info["reason"],
-                        "last_log_time": last_log_time,
-                        "created_time": created_time,
-                    }
-                )
-
-            # Process regular containers (always use pod/container format)
-            for container in containers:
-                container_id = f"{pod_name}/{container}"
-                last_log_time = get_last_log_timestamp(pod_name, container)
-
-                pod_info.append(
-                    {
-                        "id": container_id,
-                        "pod_name": pod_name,
-                        "container_name": container,
-                        "type": "container",
-                        "health_status": health_info["status"],
-                        "health_reason": health_info["reason"],
-                        "last_log_time": last_log_time,
-                        "created_time": created_time,
-                    }
-                )
-
-        app.logger.info(f"Found {len(pod_info)} pod/container combinations in namespace '{KUBE_NAMESPACE}'")
-        return jsonify(
-            {
-                "namespace": KUBE_NAMESPACE,
-                "pods": pod_info,
-                "current_pod": KUBE_POD_NAME,
-            }
-        )
+        with _pods_cache_lock:
+            # Holding the lock while building means concurrent requests wait for one build instead of each
+            # hitting the kube-apiserver.
+            cache_entry = _pods_cache.get(exclude_self)
+            if cache_entry is None or time.monotonic() - cache_entry["ts"] >= RESPONSE_CACHE_TTL_SECONDS:
+                cache_entry = _make_json_cache_entry(_build_pods_payload(exclude_self))
+                _pods_cache[exclude_self] = cache_entry
+        return _cached_json_response(cache_entry, RESPONSE_CACHE_TTL_SECONDS)
     except ApiException as e:
         app.logger.error(f"Kubernetes API error fetching pods: {e.status} - {e.reason} - {e.body}")
         error_message, status_code = format_k8s_error(e)
@@ -676,13 +1172,17 @@ def readiness_probe():
     Returns 200 if pods can be listed, 503 otherwise.
     Does not log requests to avoid log spam.
     """
+    # A synced pod cache means pods have been listed successfully, no API round-trip needed
+    if pod_cache.is_synced():
+        return "", 200
+
     try:
         # Temporarily disable logging for this check
         original_level = app.logger.level
         app.logger.setLevel(logging.ERROR)
 
-        # Try to list pods
-        v1.list_namespaced_pod(namespace=KUBE_NAMESPACE)
+        # Try to list pods, served from the apiserver watch cache since only reachability matters here
+        v1.list_namespaced_pod(namespace=KUBE_NAMESPACE, resource_version="0")
 
         # Restore logging level
         app.logger.setLevel(original_level)
@@ -700,9 +1200,10 @@ def get_logs():
     Query Parameters:
         - pod_name (required): The name of the pod/container (format: 'pod' or 'pod/container') or 'all' for all pods.
         - sort_order (optional, default 'desc'): 'asc' (oldest first) or 'desc' (newest first).
-        - tail_lines (optional, default '100'): Number of lines to fetch. '0' means all lines. When searching, all logs are fetched first, then filtered by search term, then limited by tail_lines.
+        - tail_lines (optional, default '100'): Number of lines to fetch. '0' means all lines. When searching, the newest max(tail_lines, 1000) * SEARCH_WINDOW_MULTIPLIER lines of each container are fetched first (all lines for '0'), then filtered by search term, then limited by tail_lines.
         - search_string (optional): String to filter log messages by.
         - case_sensitive (optional, default 'false'): 'true' for case-sensitive search, 'false' for case-insensitive.
+        - format (optional, default 'json'): 'ndjson' streams the entries as newline-delimited JSON instead.
     Returns a JSON object with a list of log entries, each with 'timestamp', 'message', 'pod_name', and 'container_name'.
     """
     global KUBE_NAMESPACE, v1
@@ -711,6 +1212,7 @@ def get_logs():
     tail_lines_str = request.args.get("tail_lines", "100")
     search_string = request.args.get("search_string", "").strip()
     case_sensitive = request.args.get("case_sensitive", "false").lower() == "true"
+    stream_ndjson = request.args.get("format", "json").lower() == "ndjson"
 
     app.logger.info(
         f"Request for /api/logs: pod='{pod_name_req}', sort='{sort_order}', lines='{tail_lines_str}', search='{search_string}'"
@@ -727,98 +1229,56 @@ def get_logs():
     except ValueError:
         return jsonify({"message": "Invalid number for tail_lines."}), 400
 
-    # When searching, fetch more logs to ensure we don't miss results
-    # If there's a search term, use a larger window or all logs
-    k8s_tail_lines = None if search_string else tail_lines
+    # When searching, fetch a window of the newest lines much larger than tail_lines so enough matches are found,
+    # without pulling a container's entire log history across the network; tail_lines=0 searches all logs.
+    # No limitBytes here: the apiserver counts it from the start of the window, so hitting it would silently
+    # drop the newest lines, and tail_lines already bounds the window.
+    if not search_string:
+        k8s_tail_lines = tail_lines
+    elif tail_lines:
+        k8s_tail_lines = max(tail_lines, 1000) * SEARCH_WINDOW_MULTIPLIER
+    else:
+        k8s_tail_lines = None
 
     try:
         if pod_name_req == "all":
-            pod_list_response = v1.list_namespaced_pod(namespace=KUBE_NAMESPACE)
-            all_logs = []
-
-            for pod in pod_list_response.items:
-                if pod.metadata.name == KUBE_POD_NAME:
-                    continue
-
-                pod_name = pod.metadata.name
-
-                # Process init containers first
-                for init_container in pod.spec.init_containers or []:
-                    container_name = f"init-{init_container.name}"
-                    try:
-                        log_data_stream = _fetch_pod_logs_with_retry(
-                            pod_name=pod_name, container_name=init_container.name, tail_lines=k8s_tail_lines
-                        )
-                        raw_log_lines = log_data_stream.splitlines()
-                        for line_str in raw_log_lines:
-                            if not line_str:
-                                continue
-                            log_entry = parse_log_line(line_str)
-                            if search_string:
-                                search_text = log_entry["message"] if case_sensitive else log_entry["message"].lower()
-                                search_term = search_string if case_sensitive else search_string.lower()
-                                if search_term not in search_text:
-                                    continue
-                            log_entry["pod_name"] = pod_name
-                            log_entry["container_name"] = container_name
-                            all_logs.append(log_entry)
-                    except ApiException as e:
-                        app.logger.warning(
-                            f"Could not fetch logs for pod {pod_name} init container {init_container.name}: {e.status} - {e.reason}"
-                        )
-                        error_message, _ = format_k8s_error(e)
-                        error_entry = create_error_log_entry(
-                            pod_name=pod_name,
-                            container_name=container_name,
-                            error_message=error_message,
-                            error_type="log_fetch_error",
-                        )
-                        all_logs.append(error_entry)
-
-                # Process regular containers
-                for container in pod.spec.containers:
-                    container_name = container.name
-                    try:
-                        log_data_stream = _fetch_pod_logs_with_retry(
-                            pod_name=pod_name, container_name=container_name, tail_lines=k8s_tail_lines
-                        )
-                        raw_log_lines = log_data_stream.splitlines()
-                        for line_str in raw_log_lines:
-                            if not line_str:
-                                continue
-                            log_entry = parse_log_line(line_str)
-                            if search_string:
-                                search_text = log_entry["message"] if case_sensitive else log_entry["message"].lower()
-                                search_term = search_string if case_sensitive else search_string.lower()
-                                if search_term not in search_text:
-                                    continue
-                            log_entry["pod_name"] = pod_name
-                            log_entry["container_name"] = container_name
-                            all_logs.append(log_entry)
-                    except ApiException as e:
-                        app.logger.warning(
-                            f"Could not fetch logs for pod {pod_name} container {container_name}: {e.status} - {e.reason}"
-                        )
-                        error_message, _ = format_k8s_error(e)
-                        error_entry = create_error_log_entry(
-                            pod_name=pod_name,
-                            container_name=container_name,
-                            error_message=error_message,
-                            error_type="log_fetch_error",
-                        )
-                        all_logs.append(error_entry)
+            # (pod name, container name, is init container) for every container to fetch, pod by pod with
+            # init containers first
+            targets = [
+                (pod.metadata.name, container.name, is_init)
+                for pod in _list_pods()
+                if pod.metadata.name != KUBE_POD_NAME
+                for containers, is_init in ((pod.spec.init_containers or [], True), (pod.spec.containers, False))
+                for container in containers
+            ]
+            futures = [
+                LOG_FETCH_POOL.submit(
+                    _fetch_container_logs,
+                    pod_name,
+                    container_name,
+                    is_init,
+                    k8s_tail_lines,
+                    tail_lines,
+                    search_string,
+                    case_sensitive,
+                )
+                for pod_name, container_name, is_init in targets
+            ]
 
-            all_logs.sort(
-                key=lambda x: x.get("timestamp") or "0000-00-00T00:00:00Z",
-                reverse=(sort_order == "desc"),
-            )
+            # Each container's log is already in chronological order, so a linear k-way merge replaces a full sort
+            per_container_logs = [future.result() for future in futures]
+            merged_logs = heapq.merge(*per_container_logs, key=log_sort_key)
+            if stream_ndjson and sort_order == "asc" and not tail_lines:
+                return ndjson_response(merged_logs)
+            all_logs = list(merged_logs)
 
             if tail_lines is not None and tail_lines > 0:
-                if sort_order == "desc":
-                    all_logs = all_logs[:tail_lines]
-                else:
-                    all_logs = all_logs[-tail_lines:]
+                all_logs = all_logs[-tail_lines:]
+            if sort_order == "desc":
+                all_logs.reverse()
 
+            if stream_ndjson:
+                return ndjson_response(all_logs)
             return jsonify({"logs": all_logs})
         else:  # Single pod/container
             # Split pod_name into pod and container if it contains a slash
@@ -836,28 +1296,24 @@ def get_logs():
             else:
                 actual_container_name = container_name
 
-            log_data_stream = _fetch_pod_logs_with_retry(
-                pod_name=pod_name, container_name=actual_container_name, tail_lines=k8s_tail_lines
+            log_response = _fetch_pod_logs_with_retry(
+                pod_name=pod_name,
+                container_name=actual_container_name,
+                tail_lines=k8s_tail_lines,
+            )
+            log_lines = iter_log_lines(log_response, prefilter=build_search_prefilter(search_string, case_sensitive))
+            if stream_ndjson and sort_order == "asc" and not tail_lines:
+                # Lines are requested with timestamps and arrive oldest first, which is already ascending order,
+                # so entries are sent as they are parsed instead of after the whole log has been read.
+                return ndjson_response(
+                    iter_processed_log_lines(log_lines, pod_name, container_name, search_string, case_sensitive)
+                )
+            processed_logs = process_log_lines(
+                log_lines, pod_name, container_name, search_string, case_sensitive, tail_lines
             )
-
-            raw_log_lines = log_data_stream.splitlines()
-            processed_logs = []
-            for line_str in raw_log_lines:
-                if not line_str:
-                    continue
-                log_entry = parse_log_line(line_str)
-                if search_string:
-                    search_text = log_entry["message"] if case_sensitive else log_entry["message"].lower()
-                    search_term = search_string if case_sensitive else search_string.lower()
-                    if search_term not in search_text:
-                        continue
-                log_entry["pod_name"] = pod_name
-                if container_name:
-                    log_entry["container_name"] = container_name
-                processed_logs.append(log_entry)
 
             processed_logs.sort(
-                key=lambda x: x.get("timestamp") or "0000-00-00T00:00:00Z",
+                key=log_sort_key,
                 reverse=(sort_order == "desc"),
             )
 
@@ -867,6 +1323,8 @@ def get_logs():
                 else:
                     processed_logs = processed_logs[-tail_lines:]
 
+            if stream_ndjson:
+                return ndjson_response(processed_logs)
             return jsonify({"logs": processed_logs})
 
     except ApiException as e:
@@ -915,6 +1373,36 @@ def get_logs():
         ), 500
 
 
+def _list_archived_log_files():
+    """
+    Return the pod/container names of all archived log files in LOG_DIR.
+    The directory scan is cached until LOG_DIR's mtime changes (a new pod directory was created or removed)
+    or RESPONSE_CACHE_TTL_SECONDS elapses.
+    """
+    mtime_ns = os.stat(LOG_DIR).st_mtime_ns
+    with _archived_files_cache_lock:
+        if (
+            _archived_files_cache["mtime_ns"] == mtime_ns
+            and time.monotonic() - _archived_files_cache["ts"] < RESPONSE_CACHE_TTL_SECONDS
+        ):
+            return _archived_files_cache["files"]
+
+        # Get relative path from LOG_DIR and remove .log extension to get pod/container name
+        files = [os.path.relpath(entry.path, LOG_DIR)[:-4] for entry in iter_log_files(LOG_DIR)]
+
+        _archived_files_cache.update(ts=time.monotonic(), mtime_ns=mtime_ns, files=files)
+        return files
+
+
+def _clear_archived_files_cache():
+    """
+    Drop the cached archived file list. Needed after deleting log files: they live in pod subdirectories,
+    so deleting them does not change LOG_DIR's mtime.
+    """
+    with _archived_files_cache_lock:
+        _archived_files_cache.update(ts=0.0, mtime_ns=None, files=[])
+
+
 @app.route("/api/archived_pods", methods=["GET"])
 @require_api_key
 def get_archived_pods():
@@ -937,12 +1425,7 @@ def get_archived_pods():
             # Get list of currently running pods to exclude from archived list
             running_pod_containers = set()
             try:
-                pod_list_response = v1.list_namespaced_pod(namespace=KUBE_NAMESPACE)
-                for pod in pod_list_response.items:
-                    pod_name = pod.metadata.name
-                    containers = [container.name for container in pod.spec.containers]
-                    init_containers = [container.name for container in (pod.spec.init_containers or [])]
-
+                for pod_name, containers, init_containers in _list_pod_containers():
                     # Add init containers with "init-" prefix
                     for init_container in init_containers:
                         running_pod_containers.add(f"{pod_name}/init-{init_container}")
@@ -955,18 +1438,10 @@ def get_archived_pods():
                 running_pod_containers = set()
 
             # List archived log files and exclude currently running pods
-            # Use os.walk to search subdirectories since multi-container pods create subdirectories
-            for root, _, files in os.walk(LOG_DIR):
-                for filename in files:
-                    if filename.endswith(".log"):
-                        # Get relative path from LOG_DIR to construct pod/container name
-                        file_path = os.path.join(root, filename)
-                        relative_path = os.path.relpath(file_path, LOG_DIR)
-                        # Remove .log extension to get pod/container name
-                        pod_container = relative_path[:-4]
-                        # Exclude current pod and any currently running pods
-                        if KUBE_POD_NAME not in pod_container and pod_container not in running_pod_containers:
-                            archived_pod_names.append(pod_container)
+            for pod_container in _list_archived_log_files():
+                # Exclude current pod and any currently running pods
+                if KUBE_POD_NAME not in pod_container and pod_container not in running_pod_containers:
+                    archived_pod_names.append(pod_container)
 
             app.logger.info(f"Found {len(archived_pod_names)} previous (non-running) pod/container logs in {LOG_DIR}.")
         except OSError as e:
@@ -975,7 +1450,142 @@ def get_archived_pods():
     else:
         app.logger.info(f"Previous pod logs directory {LOG_DIR} does not exist.")
 
-    return jsonify({"archived_pods": archived_pod_names})
+    response = jsonify({"archived_pods": archived_pod_names})
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _read_archived_log_entries(log_file_path, source_fields):
+    """Parse an archived log file into entries sorted by timestamp, adding pod and container information."""
+    entries = []
+    parse = parse_log_line
+    append = entries.append
+    with open(log_file_path, "r", encoding="utf-8") as f:
+        for line_str in f:
+            if not line_str.strip():
+                continue
+            log_entry = parse(line_str)
+            log_entry.update(source_fields)
+            append(log_entry)
+    entries.sort(key=log_sort_key)
+    return entries
+
+
+def _evict_archived_log_cache():
+    """Evict least recently used records until the cache fits its limits. Must be called with the lock held."""
+    cached_bytes = sum(record["cost"] for record in _archived_log_cache.values())
+    while _archived_log_cache and (
+        len(_archived_log_cache) > ARCHIVED_LOG_CACHE_MAX_FILES or cached_bytes > ARCHIVED_LOG_CACHE_MAX_BYTES
+    ):
+        _, evicted_record = _archived_log_cache.popitem(last=False)
+        cached_bytes -= evicted_record["cost"]
+
+
+def _get_archived_log_entries(log_file_path, file_stats, source_fields):
+    """
+    Return the cache record of an archived log file: {"entries": sorted entries, "cost": estimated memory}.
+    The file is only read and parsed again when its mtime or size changed.
+    Records are shared between requests and must not be modified.
+    """
+    key = (log_file_path, file_stats.st_mtime_ns, file_stats.st_size)
+    with _archived_log_cache_lock:
+        cache_record = _archived_log_cache.get(key)
+        if cache_record is not None:
+            _archived_log_cache.move_to_end(key)
+            return cache_record
+
+    entries = _read_archived_log_entries(log_file_path, source_fields)
+    app.logger.info(f"Read {len(entries)} lines from archived file {log_file_path}.")
+    cost = file_stats.st_size + len(entries) * ARCHIVED_ENTRY_OVERHEAD_BYTES
+    cache_record = {"entries": entries, "cost": cost}
+
+    if cost <= ARCHIVED_LOG_CACHE_MAX_BYTES:
+        with _archived_log_cache_lock:
+            # Previous versions of a rewritten file can never be hit again
+            for stale_key in [k for k in _archived_log_cache if k[0] == log_file_path]:
+                del _archived_log_cache[stale_key]
+            _archived_log_cache[key] = cache_record
+            _evict_archived_log_cache()
+    return cache_record
+
+
+@lru_cache(maxsize=256)
+def _archived_search_prefilter(search_string, case_sensitive):
+    """
+    Compile a bytes pattern that finds every raw line whose parsed message can contain search_string.
+    Lines containing ESC are always candidates because removing ANSI codes can join a match, and for
+    case-insensitive searches so are lines with non-ASCII bytes, since bytes patterns only fold ASCII case.
+    Returns None when the search could match the truncation marker, where raw lines are not a superset.
+    """
+    if search_can_match_truncation_marker(search_string, case_sensitive):
+        return None
+    escaped = re.escape(search_string.encode("utf-8"))
+    if case_sensitive:
+        return re.compile(escaped + rb"|\x1b")
+    return re.compile(rb"(?i:" + escaped + rb")|[\x1b\x80-\xff]")
+
+
+def _iter_candidate_lines(mm, pattern):
+    """
+    Yield the lines of a memory-mapped log file that contain a match of pattern, in file order.
+    Lines are split like a text-mode file iterator would (on "\n", "\r\n" and "\r").
+    """
+    search = pattern.search
+    match = search(mm)
+    while match:
+        line_start = mm.rfind(b"\n", 0, match.start()) + 1
+        line_end = mm.find(b"\n", match.end())
+        if line_end == -1:
+            line_end = len(mm)
+        yield from mm[line_start:line_end].decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        match = search(mm, line_end + 1)
+
+
+def _newest_entries(entries, count, sort_order):
+    """Return the count entries a stable sort in sort_order followed by the tail slice keeps, in their original order."""
+    indexes = sorted(range(len(entries)), key=lambda i: log_sort_key(entries[i]), reverse=(sort_order == "desc"))
+    kept = indexes[:count] if sort_order == "desc" else indexes[-count:]
+    return [entries[i] for i in sorted(kept)]
+
+
+def _scan_archived_log_file(log_file_path, source_fields, search_string, case_sensitive, sort_order, tail_lines):
+    """
+    Filter, sort and limit the entries of an archived log file larger than ARCHIVED_LOG_SCAN_MIN_BYTES.
+    Lines are parsed one at a time and, with tail_lines, only the entries that will be returned are kept, so
+    memory follows the response size rather than the file size. Searches first locate candidate lines with a
+    regex over the memory-mapped file, so lines that cannot match are never decoded or parsed.
+    """
+    matches_search = build_search_matcher(search_string, case_sensitive)
+    prefilter = _archived_search_prefilter(search_string, case_sensitive) if search_string else None
+
+    with open(log_file_path, encoding="utf-8") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if prefilter else None
+        try:
+            lines = _iter_candidate_lines(mm, prefilter) if prefilter else f
+            entries = []
+            parse = parse_log_line
+            append = entries.append
+            for line_str in lines:
+                if not line_str.strip():
+                    continue
+                log_entry = parse(line_str)
+                if matches_search and not matches_search(log_entry["message"]):
+                    continue
+                log_entry.update(source_fields)
+                append(log_entry)
+                # Trim to the entries the stable sort and slice below would return: the newest tail_lines,
+                # ties going to the later line for ascending order and the earlier line for descending order
+                if tail_lines and len(entries) >= 2 * tail_lines:
+                    entries = _newest_entries(entries, tail_lines, sort_order)
+                    append = entries.append
+        finally:
+            if mm is not None:
+                mm.close()
+
+    entries.sort(key=log_sort_key, reverse=(sort_order == "desc"))
+    if tail_lines:
+        entries = entries[:tail_lines] if sort_order == "desc" else entries[-tail_lines:]
+    return entries
 
 
 @app.route("/api/archived_logs", methods=["GET"])
@@ -1025,39 +1635,37 @@ def get_archived_logs():
         return jsonify({"message": "Invalid number for tail_lines."}), 400
 
     try:
-        with open(log_file_path, "r", encoding="utf-8") as f:
-            raw_log_lines = f.readlines()
-
-        app.logger.info(f"Read {len(raw_log_lines)} lines from archived file {log_file_path}.")
+        # Pod and container information added to every entry
+        if "/" in pod_name:
+            pod, container = pod_name.split("/", 1)
+            source_fields = {"pod_name": pod, "container_name": container}
+        else:
+            source_fields = {"pod_name": pod_name}
 
-        processed_logs = []
-        for line_str in raw_log_lines:
-            if not line_str.strip():
-                continue
-            log_entry = parse_log_line(line_str)
-            if search_string:
-                search_text = log_entry["message"] if case_sensitive else log_entry["message"].lower()
-                search_term = search_string if case_sensitive else search_string.lower()
-                if search_term not in search_text:
-                    continue
+        file_stats = os.stat(log_file_path)
+        if file_stats.st_size > ARCHIVED_LOG_SCAN_MIN_BYTES:
+            processed_logs = _scan_archived_log_file(
+                log_file_path, source_fields, search_string, case_sensitive, sort_order, tail_lines
+            )
+            app.logger.info(f"{len(processed_logs)} lines returned from large archived file {log_file_path}.")
+            return jsonify({"logs": processed_logs})
 
-            # Add pod and container information
-            if "/" in pod_name:
-                pod, container = pod_name.split("/", 1)
-                log_entry["pod_name"] = pod
-                log_entry["container_name"] = container
-            else:
-                log_entry["pod_name"] = pod_name
+        cache_record = _get_archived_log_entries(log_file_path, file_stats, source_fields)
+        entries = cache_record["entries"]
 
-            processed_logs.append(log_entry)
+        # The cached entries are shared between requests, so they are filtered into new lists and never modified.
+        # Searches use the same matcher as live logs, so both agree on case folding.
+        matches_search = build_search_matcher(search_string, case_sensitive)
+        if matches_search:
+            processed_logs = [entry for entry in entries if matches_search(entry["message"])]
+        else:
+            processed_logs = entries
 
         app.logger.info(f"{len(processed_logs)} lines after search filter for archived pod/container '{pod_name}'.")
 
-        # Sort by timestamp
-        processed_logs.sort(
-            key=lambda x: x.get("timestamp") or "0000-00-00T00:00:00Z",
-            reverse=(sort_order == "desc"),
-        )
+        # Entries are cached in ascending timestamp order, descending order is a stable sort of that
+        if sort_order == "desc":
+            processed_logs = sorted(processed_logs, key=log_sort_key, reverse=True)
 
         if tail_lines is not None and tail_lines > 0:
             if sort_order == "desc":
@@ -1081,7 +1689,8 @@ def get_log_dir_stats_endpoint():
     """
     API endpoint to get statistics about the log directory.
     Returns:
-        - total_size_miBytes: Total size of all log files in miBytes
+        - total_size_bytes: Total size of all log files in bytes
+        - total_size_mibytes: The same size in MiB, kept for existing clients
         - file_count: Number of log files
         - oldest_file_date: Creation date of the oldest log file
         - enabled: Whether log archiving is enabled
@@ -1096,6 +1705,7 @@ def get_log_dir_stats_endpoint():
             jsonify(
                 {
                     "enabled": True,
+                    "total_size_bytes": 0,
                     "total_size_mibytes": 0,
                     "file_count": 0,
                     "oldest_file_date": None,
@@ -1106,37 +1716,18 @@ def get_log_dir_stats_endpoint():
         )
 
     try:
-        total_size = 0
-        file_count = 0
-        oldest_date = None
-
-        # Walk through directory recursively
-        for root, _, files in os.walk(LOG_DIR):
-            for filename in files:
-                if filename.endswith(".log"):
-                    file_path = os.path.join(root, filename)
-                    file_stats = os.stat(file_path)
-
-                    # Update total size
-                    total_size += file_stats.st_size
-                    file_count += 1
-
-                    # Update oldest date
-                    creation_time = file_stats.st_ctime
-                    if oldest_date is None or creation_time < oldest_date:
-                        oldest_date = creation_time
+        total_size, file_count, oldest_date = get_cached_log_dir_stats(LOG_DIR, 2 * LOG_DIR_STATS_TTL_SECONDS)
 
         # Convert oldest_date to ISO format if it exists
         oldest_date_iso = None
         if oldest_date is not None:
-            from datetime import datetime
-
             oldest_date_iso = datetime.fromtimestamp(oldest_date).isoformat()
 
         return jsonify(
             {
                 "enabled": True,
-                "total_size_mibytes": total_size / 1024 / 1024,
+                "total_size_bytes": total_size,
+                "total_size_mibytes": total_size / 1048576,
                 "file_count": file_count,
                 "oldest_file_date": oldest_date_iso,
                 "log_directory": LOG_DIR,
@@ -1148,6 +1739,17 @@ def get_log_dir_stats_endpoint():
         return jsonify({"message": f"An unexpected error occurred: {str(e)}"}), 500
 
 
+# The purge flags are fixed once the log archival configuration is loaded, so the body is serialized only once.
+# A new Response is still built per request because Flask mutates responses (headers, cookies) on the way out.
+_PURGE_CAPABILITY_BODY = app.json.response(
+    {
+        "purge_allowed": RETAIN_ALL_POD_LOGS and ALLOW_PREVIOUS_LOG_PURGE,
+        "logs_enabled": RETAIN_ALL_POD_LOGS,
+        "purge_enabled": ALLOW_PREVIOUS_LOG_PURGE,
+    }
+).get_data()
+
+
 @app.route("/api/purgeCapability", methods=["GET"])
 @require_api_key
 def get_purge_capability():
@@ -1155,15 +1757,7 @@ def get_purge_capability():
     API endpoint to check if previous log purging is allowed.
     Returns a JSON object indicating if purge functionality is available.
     """
-    global RETAIN_ALL_POD_LOGS, ALLOW_PREVIOUS_LOG_PURGE
-
-    return jsonify(
-        {
-            "purge_allowed": RETAIN_ALL_POD_LOGS and ALLOW_PREVIOUS_LOG_PURGE,
-            "logs_enabled": RETAIN_ALL_POD_LOGS,
-            "purge_enabled": ALLOW_PREVIOUS_LOG_PURGE,
-        }
-    )
+    return app.response_class(_PURGE_CAPABILITY_BODY, mimetype="application/json")
 
 
 @app.route("/api/purgePreviousLogs", methods=["POST"])
@@ -1184,7 +1778,10 @@ def purge_previous_logs():
     try:
         from log_archiver import purge_previous_pod_logs
 
-        deleted_count, error_count = purge_previous_pod_logs(LOG_DIR, app.logger)
+        try:
+            deleted_count, error_count = purge_previous_pod_logs(LOG_DIR, app.logger)
+        finally:
+            _clear_archived_files_cache()
 
         return jsonify(
             {
@@ -1199,13 +1796,16 @@ def purge_previous_logs():
         return jsonify({"success": False, "message": f"An unexpected error occurred: {str(e)}"}), 500
 
 
+_VERSION_BODY = app.json.response({"version": __version__}).get_data()
+
+
 @app.route("/api/version", methods=["GET"])
 def get_version():
     """
     API endpoint to get the application version.
     Returns a JSON object with the current version.
     """
-    return jsonify({"version": __version__})
+    return app.response_class(_VERSION_BODY, mimetype="application/json")
 
 
 # --- Events API Endpoints ---
@@ -1637,8 +2237,6 @@ def download_pod_logs():
                             arcname = f"archived_{os.path.relpath(file_path, LOG_DIR)}"
                             zipf.write(file_path, arcname)
 
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{pod_name}_logs_{timestamp}.zip"
 
@@ -1669,7 +2267,8 @@ def download_all_logs():
         with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
             temp_zip_path = temp_zip.name
 
-        # Create the zip file
+        # Create the zip file, counting the files for the download name as they are added
+        file_count = 0
         with zipfile.ZipFile(temp_zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
             # Walk through the log directory and add all .log files
             for root, _, files in os.walk(LOG_DIR):
@@ -1679,10 +2278,7 @@ def download_all_logs():
                         # Get relative path from LOG_DIR for the zip archive
                         arcname = os.path.relpath(file_path, LOG_DIR)
                         zipf.write(file_path, arcname)
-
-        # Get stats for the filename
-        total_size, file_count, _ = get_log_dir_stats(LOG_DIR)
-        from datetime import datetime
+                        file_count += 1
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"logpilot_logs_{file_count}files_{timestamp}.zip"
@@ -1696,4 +2292,5 @@ def download_all_logs():
 
 # --- Main Execution ---
 if __name__ == "__main__":
+    pod_cache.start()
     app.run(host="0.0.0.0", port=5001, debug=False)
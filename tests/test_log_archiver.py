@@ -0,0 +1,295 @@
+"""
+Unit tests for the log archive directory helpers.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import log_archiver
+
+    refresh_log_dir_stats = log_archiver.refresh_log_dir_stats
+    iter_log_files = log_archiver.iter_log_files
+except ImportError as e:
+    pytest.skip(f"Could not import log_archiver module: {e}", allow_module_level=True)
+
+
+def write_file(path, content):
+    """Create a file and any missing parent directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """A log directory laid out the way the archiver writes it."""
+    write_file(str(tmp_path / "pod-a" / "app.log"), "a" * 10)
+    write_file(str(tmp_path / "pod-a" / "init-setup.log"), "b" * 20)
+    write_file(str(tmp_path / "pod-b" / "web.log"), "c" * 30)
+    write_file(str(tmp_path / "pod-b" / "notes.txt"), "ignored")
+    write_file(str(tmp_path / "legacy.log"), "d" * 40)
+    return str(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def reset_stats_counter(monkeypatch):
+    """Start every test with an unseeded stats counter."""
+    monkeypatch.setattr(log_archiver, "stats_counter", log_archiver.StatsCounter())
+
+
+class TestIterLogFiles:
+    """Test the recursive .log file scan."""
+
+    def test_finds_log_files_in_subdirectories(self, log_dir):
+        """Test that .log files are found at every depth and other files are skipped."""
+        names = sorted(os.path.relpath(entry.path, log_dir) for entry in iter_log_files(log_dir))
+
+        assert names == ["legacy.log", "pod-a/app.log", "pod-a/init-setup.log", "pod-b/web.log"]
+
+    def test_directory_named_like_log_is_descended(self, log_dir):
+        """Test that a directory ending in .log is treated as a directory, not a file."""
+        write_file(os.path.join(log_dir, "pod-c.log", "app.log"), "e")
+
+        names = sorted(os.path.relpath(entry.path, log_dir) for entry in iter_log_files(log_dir))
+
+        assert "pod-c.log" not in names
+        assert "pod-c.log/app.log" in names
+
+
+class TestIterLogFileBatches:
+    """Test the per-directory .log file batches."""
+
+    def test_batches_group_files_by_directory(self, log_dir):
+        """Test that each directory yields its own .log names and an fd they can be stat-ed against."""
+        batches = []
+        for _, dir_fd, names in log_archiver.iter_log_file_batches(log_dir):
+            assert all(os.stat(name, dir_fd=dir_fd).st_size > 0 for name in names)
+            batches.append(sorted(names))
+
+        assert sorted(batches) == [["app.log", "init-setup.log"], ["legacy.log"], ["web.log"]]
+
+
+class TestOpenLogDir:
+    """Test scanning a log directory through the fd opened at startup."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_fds(self, monkeypatch):
+        """Give every test its own fd registry and close the fds it opened."""
+        fds = {}
+        monkeypatch.setattr(log_archiver, "_log_dir_fds", fds)
+        yield
+        for fd in fds.values():
+            os.close(fd)
+
+    def test_scan_uses_the_registered_fd(self, log_dir, tmp_path_factory):
+        """Test that pod directories are opened relative to the fd, not by re-resolving the path."""
+        log_archiver.open_log_dir(log_dir)
+        log_archiver.open_log_dir(log_dir)
+        assert len(log_archiver._log_dir_fds) == 1
+        assert refresh_log_dir_stats(log_dir)[:2] == (100, 4)
+
+        # The fd still reaches the directory after the path no longer does
+        os.rename(log_dir, str(tmp_path_factory.mktemp("moved") / "logs"))
+        file_stats = log_archiver.iter_log_file_stats(log_dir)
+
+        assert sorted(os.path.relpath(path, log_dir) for path, _, _ in file_stats) == [
+            "legacy.log",
+            "pod-a/app.log",
+            "pod-a/init-setup.log",
+            "pod-b/web.log",
+        ]
+
+
+class TestRefreshLogDirStats:
+    """Test the full log directory scan behind the statistics."""
+
+    def test_stats_include_subdirectories(self, log_dir):
+        """Test that size and count cover the per-pod subdirectories."""
+        total_size, file_count, oldest_date = refresh_log_dir_stats(log_dir)
+
+        assert total_size == 100
+        assert file_count == 4
+        assert oldest_date is not None
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing log directory reports empty stats."""
+        assert refresh_log_dir_stats(str(tmp_path / "missing")) == (0, 0, None)
+
+    def test_symlinks_are_not_followed(self, log_dir, tmp_path_factory):
+        """Test that symlinked files and directories are not counted."""
+        outside = tmp_path_factory.mktemp("outside")
+        write_file(str(outside / "other" / "big.log"), "x" * 1000)
+        os.symlink(str(outside / "other"), os.path.join(log_dir, "linked-pod"))
+        os.symlink(str(outside / "other" / "big.log"), os.path.join(log_dir, "pod-a", "linked.log"))
+
+        assert refresh_log_dir_stats(log_dir)[:2] == (100, 4)
+
+
+class TestStatSizeCtime:
+    """Test the statx-backed size and ctime lookup."""
+
+    def test_matches_os_stat(self, log_dir):
+        """Test that the result agrees with os.stat, relative to a directory fd as well."""
+        path = os.path.join(log_dir, "pod-a", "app.log")
+        file_stats = os.stat(path, follow_symlinks=False)
+
+        assert log_archiver.stat_size_ctime(path) == (file_stats.st_size, pytest.approx(file_stats.st_ctime))
+        dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+        try:
+            assert log_archiver.stat_size_ctime("app.log", dir_fd=dir_fd)[0] == 10
+        finally:
+            os.close(dir_fd)
+
+    def test_falls_back_to_os_stat(self, log_dir, monkeypatch):
+        """Test that os.stat is used when statx is unavailable."""
+        monkeypatch.setattr(log_archiver, "_libc_statx", None)
+
+        assert log_archiver.stat_size_ctime(os.path.join(log_dir, "pod-b", "web.log"))[0] == 30
+        assert refresh_log_dir_stats(log_dir)[:2] == (100, 4)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError like os.stat."""
+        with pytest.raises(FileNotFoundError):
+            log_archiver.stat_size_ctime(str(tmp_path / "missing.log"))
+
+
+class TestCachedLogDirStats:
+    """Test the log directory stats served to the stats endpoint."""
+
+    def test_first_call_computes_and_later_calls_reuse_snapshot(self, log_dir):
+        """Test that a fresh snapshot is returned without rescanning the directory."""
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (100, 4)
+
+        write_file(os.path.join(log_dir, "pod-c", "app.log"), "e" * 50)
+
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (100, 4)
+        assert log_archiver.refresh_log_dir_stats(log_dir)[:2] == (150, 5)
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (150, 5)
+
+    def test_stale_snapshot_is_recomputed(self, log_dir):
+        """Test that a snapshot older than the maximum age is replaced by a synchronous scan."""
+        log_archiver.refresh_log_dir_stats(log_dir)
+        write_file(os.path.join(log_dir, "pod-c", "app.log"), "e" * 50)
+
+        assert log_archiver.get_cached_log_dir_stats(log_dir, -1)[:2] == (150, 5)
+
+    def test_archiver_writes_and_deletes_update_the_counter(self, log_dir):
+        """Test that counted writes and deletes are reflected without a rescan."""
+        log_archiver.refresh_log_dir_stats(log_dir)
+        new_path = os.path.join(log_dir, "pod-c", "app.log")
+        write_file(new_path, "e" * 50)
+        log_archiver.stats_counter.add(new_path, *log_archiver.stat_size_ctime(new_path))
+
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (150, 5)
+
+        os.remove(new_path)
+        log_archiver.stats_counter.remove(new_path)
+
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (100, 4)
+
+    def test_concurrent_refreshes_share_one_scan(self, log_dir, monkeypatch):
+        """Test that a refresh started while another is running waits for it instead of scanning again."""
+        scan_started = threading.Event()
+        release_scan = threading.Event()
+        scans = []
+        scan = log_archiver.iter_log_file_stats
+
+        def slow_scan(path):
+            """Block the first scan until the second caller is waiting on it."""
+            scans.append(path)
+            scan_started.set()
+            release_scan.wait(5)
+            return scan(path)
+
+        monkeypatch.setattr(log_archiver, "iter_log_file_stats", slow_scan)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(log_archiver.refresh_log_dir_stats(log_dir)))]
+        threads[0].start()
+        assert scan_started.wait(5)
+        threads.append(threading.Thread(target=lambda: results.append(log_archiver.refresh_log_dir_stats(log_dir))))
+        threads[1].start()
+        time.sleep(0.1)
+        release_scan.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert scans == [log_dir]
+        assert [result[:2] for result in results] == [(100, 4), (100, 4)]
+        assert log_archiver._refreshes_in_flight == {}
+
+    def test_written_log_files_are_counted_without_a_rescan(self, log_dir):
+        """Test that the archiver's writes update the counter with the encoded size."""
+        log_archiver.refresh_log_dir_stats(log_dir)
+        new_path = os.path.join(log_dir, "pod-a", "app.log")
+        log_archiver.write_log_file(new_path, "\u00e9" * 5)  # 10 bytes in UTF-8, replacing a 10-byte file
+
+        assert os.path.getsize(new_path) == 10
+        # The rewritten file is now the newest, so the oldest is the untouched file written right after it
+        oldest_ctime = os.stat(os.path.join(log_dir, "pod-a", "init-setup.log")).st_ctime
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60) == (100, 4, pytest.approx(oldest_ctime))
+
+        log_archiver.write_log_file(os.path.join(log_dir, "pod-a", "sidecar.log"), "x" * 7)
+
+        assert log_archiver.get_cached_log_dir_stats(log_dir, 60)[:2] == (107, 5)
+
+
+class TestStatsCounter:
+    """Test the incremental log directory stats counter."""
+
+    def test_add_replace_and_remove(self):
+        """Test that totals and the oldest ctime follow adds, rewrites and removals."""
+        counter = log_archiver.StatsCounter()
+        counter.reseed([("/logs/a/app.log", 10, 100.0), ("/logs/b/web.log", 20, 200.0)])
+
+        assert counter.snapshot() == (30, 2, 100.0)
+
+        counter.add("/logs/c/app.log", 5, 50.0)
+        assert counter.snapshot() == (35, 3, 50.0)
+
+        counter.add("/logs/c/app.log", 7, 300.0)  # Rewritten in place
+        assert counter.snapshot() == (37, 3, 100.0)
+
+        counter.remove("/logs/a/app.log")
+        counter.remove("/logs/missing.log")
+        assert counter.snapshot() == (27, 2, 200.0)
+
+    def test_empty_counter(self):
+        """Test that an empty counter reports no oldest date."""
+        counter = log_archiver.StatsCounter()
+
+        assert counter.age() is None
+        counter.reseed([])
+        assert counter.snapshot() == (0, 0, None)
+        assert counter.age() >= 0
+
+
+class TestPurgePreviousPodLogs:
+    """Test purging the logs of pods that are no longer running."""
+
+    def test_only_previous_pod_logs_are_deleted(self, log_dir, monkeypatch):
+        """Test that files of running containers are kept and the rest are unlinked."""
+        container = Mock()
+        container.name = "app"
+        init_container = Mock()
+        init_container.name = "setup"
+        pod = Mock()
+        pod.metadata.name = "pod-a"
+        pod.spec.containers = [container]
+        pod.spec.init_containers = [init_container]
+        v1 = Mock()
+        v1.list_namespaced_pod.return_value = Mock(items=[pod])
+        monkeypatch.setattr(log_archiver.client, "CoreV1Api", lambda: v1)
+
+        assert log_archiver.purge_previous_pod_logs(log_dir, logging.getLogger(__name__)) == (2, 0)
+
+        names = sorted(os.path.relpath(entry.path, log_dir) for entry in iter_log_files(log_dir))
+        assert names == ["pod-a/app.log", "pod-a/init-setup.log"]
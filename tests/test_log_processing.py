@@ -0,0 +1,392 @@
+"""
+Unit tests for the log streaming and processing pipeline used by the log endpoints.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import main
+
+    build_search_matcher = main.build_search_matcher
+    build_search_prefilter = main.build_search_prefilter
+    iter_log_lines = main.iter_log_lines
+    log_sort_key = main.log_sort_key
+    ndjson_response = main.ndjson_response
+    parse_log_line = main.parse_log_line
+    process_log_lines = main.process_log_lines
+except ImportError as e:
+    pytest.skip(f"Could not import main module: {e}", allow_module_level=True)
+
+
+def make_stream_response(data, chunk_size):
+    """Build a urllib3-like streaming response that yields data in fixed-size chunks."""
+    response = Mock()
+    response.stream.return_value = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return response
+
+
+class TestParseLogLine:
+    """Test the fixed-position timestamp fast path of parse_log_line."""
+
+    def test_timestamp_must_be_followed_by_whitespace(self):
+        """Test that a timestamp-like prefix without a separator is not treated as a timestamp."""
+        result = parse_log_line("2021-09-01T12:34:56Zmessage")
+
+        assert result == {"timestamp": None, "message": "2021-09-01T12:34:56Zmessage"}
+
+    def test_malformed_timestamps_are_kept_in_message(self):
+        """Test lines whose prefix only partially matches the timestamp shape."""
+        for line in ["2021-09-01 12:34:56Z message", "2021-09-01T12:34:56.Z message", "short"]:
+            result = parse_log_line(line)
+            assert result == {"timestamp": None, "message": line}
+
+    def test_timestamp_only_line(self):
+        """Test a timestamped line with an empty message."""
+        result = parse_log_line("2021-09-01T12:34:56.5Z \n")
+
+        assert result == {"timestamp": "2021-09-01T12:34:56.5Z", "message": ""}
+
+
+class TestLogSortKey:
+    """Test the chronological sort key for log entries."""
+
+    def test_trimmed_fractional_seconds_sort_chronologically(self):
+        """Test that RFC3339Nano timestamps with trimmed fractions sort by time, not by string."""
+        timestamps = [
+            "2024-01-01T00:00:03.55Z",
+            "2024-01-01T00:00:04Z",
+            "2024-01-01T00:00:03Z",
+            "2024-01-01T00:00:03.5Z",
+            None,
+            "2024-01-01T00:00:03.123456789Z",
+        ]
+        entries = sorted(({"timestamp": ts} for ts in timestamps), key=log_sort_key)
+
+        assert [entry["timestamp"] for entry in entries] == [
+            None,
+            "2024-01-01T00:00:03Z",
+            "2024-01-01T00:00:03.123456789Z",
+            "2024-01-01T00:00:03.5Z",
+            "2024-01-01T00:00:03.55Z",
+            "2024-01-01T00:00:04Z",
+        ]
+
+
+class TestIterLogLines:
+    """Test splitting streamed log responses into lines."""
+
+    def test_lines_split_across_chunks(self):
+        """Test that lines spanning chunk boundaries are reassembled."""
+        data = b"2024-01-01T00:00:00Z first line\n2024-01-01T00:00:01Z second line\nno trailing newline"
+        response = make_stream_response(data, chunk_size=5)
+
+        assert list(iter_log_lines(response)) == [
+            "2024-01-01T00:00:00Z first line",
+            "2024-01-01T00:00:01Z second line",
+            "no trailing newline",
+        ]
+        response.release_conn.assert_called_once()
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """Test that UTF-8 sequences split between chunks are decoded correctly."""
+        data = "héllo wörld ✓\nsecond\n".encode()
+        response = make_stream_response(data, chunk_size=1)
+
+        assert list(iter_log_lines(response)) == ["héllo wörld ✓", "second"]
+
+    def test_prefilter_skips_blocks_without_matches(self):
+        """Test that blocks rejected by the prefilter are dropped while matching blocks are split into lines."""
+        data = b"2024-01-01T00:00:00Z noise\n" * 10 + b"2024-01-01T00:00:01Z Error here\n"
+        response = make_stream_response(data, chunk_size=64)
+
+        lines = list(iter_log_lines(response, chunk_size=64, prefilter=build_search_prefilter("error", False)))
+
+        assert "2024-01-01T00:00:01Z Error here" in lines
+        assert len(lines) < 11
+
+
+class TestBuildSearchMatcher:
+    """Test the search predicate used to filter log messages."""
+
+    def test_empty_search_has_no_matcher(self):
+        """Test that an empty search string disables filtering."""
+        assert build_search_matcher("", False) is None
+
+    def test_search_is_literal(self):
+        """Test that regex metacharacters in the search string are matched literally."""
+        matcher = build_search_matcher("GET /api/pods?exclude_self=true (200)", False)
+
+        assert matcher("get /API/pods?exclude_self=true (200) in 3ms")
+        assert not matcher("GET /api/podsXexclude_self=true 200")
+
+
+class TestBuildSearchPrefilter:
+    """Test the block-level prefilter used to skip raw log text that cannot match a search."""
+
+    def test_blocks_with_ansi_codes_always_pass(self):
+        """Test that ESC passes the prefilter since stripping ANSI codes can join a match."""
+        prefilter = build_search_prefilter("hello", True)
+
+        assert prefilter("2024-01-01T00:00:00Z \x1b[31mhel\x1b[0mlo\n")
+        assert not prefilter("2024-01-01T00:00:00Z goodbye\n")
+
+    def test_case_insensitive_unicode_folding(self):
+        """Test that the prefilter accepts everything the IGNORECASE message search matches."""
+        prefilter = build_search_prefilter("K", False)
+
+        assert prefilter("temperature 300\u212a\n")  # KELVIN SIGN folds to k
+        assert prefilter("ok\n")
+        assert not prefilter("none\n")
+
+    def test_no_prefilter_for_truncation_marker(self):
+        """Test that searches which can match the truncation marker are never prefiltered."""
+        assert build_search_prefilter("truncated", False) is None
+        assert build_search_prefilter("", False) is None
+
+
+class TestProcessLogLines:
+    """Test parsing, filtering and tail limiting of log lines."""
+
+    LINES = (
+        "2024-01-01T00:00:01Z INFO starting",
+        "",
+        "2024-01-01T00:00:02Z ERROR failed to connect",
+        "2024-01-01T00:00:03Z INFO retrying",
+        "2024-01-01T00:00:04Z error connection refused",
+    )
+
+    def test_entries_are_enriched(self):
+        """Test that empty lines are skipped and pod/container names are added."""
+        logs = process_log_lines(self.LINES, "pod-1", "app", "", False, None)
+
+        assert len(logs) == 4
+        assert logs[0] == {
+            "timestamp": "2024-01-01T00:00:01Z",
+            "message": "INFO starting",
+            "pod_name": "pod-1",
+            "container_name": "app",
+        }
+
+    def test_no_container_name(self):
+        """Test that container_name is omitted when not provided."""
+        logs = process_log_lines(self.LINES, "pod-1", None, "", False, None)
+
+        assert "container_name" not in logs[0]
+
+    def test_search_case_insensitive(self):
+        """Test case-insensitive search filtering."""
+        logs = process_log_lines(self.LINES, "pod-1", "app", "error", False, None)
+
+        assert [log["message"] for log in logs] == ["ERROR failed to connect", "error connection refused"]
+
+    def test_search_case_sensitive(self):
+        """Test case-sensitive search filtering."""
+        logs = process_log_lines(self.LINES, "pod-1", "app", "ERROR", True, None)
+
+        assert [log["message"] for log in logs] == ["ERROR failed to connect"]
+
+    def test_tail_lines_keeps_newest_matches(self):
+        """Test that tail_lines keeps only the newest matching entries."""
+        logs = process_log_lines(self.LINES, "pod-1", "app", "", False, 2)
+
+        assert [log["message"] for log in logs] == ["INFO retrying", "error connection refused"]
+
+
+class TestNdjsonResponse:
+    """Test streaming log entries as newline-delimited JSON."""
+
+    def test_entries_are_streamed_one_per_line(self):
+        """Test that each entry is serialized on its own line, across batch boundaries."""
+        entries = ({"timestamp": None, "message": f"line {i}", "pod_name": "pod-1"} for i in range(1201))
+
+        with main.app.test_request_context():
+            response = ndjson_response(entries)
+            body = b"".join(response.response)
+
+        assert response.mimetype == "application/x-ndjson"
+        lines = body.decode().split("\n")
+        assert lines[-1] == ""
+        assert len(lines) == 1202
+        assert json.loads(lines[1200]) == {"timestamp": None, "message": "line 1200", "pod_name": "pod-1"}
+
+
+class TestArchivedLogCache:
+    """Test the LRU cache of parsed archived log files."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and finish every test with an empty cache."""
+        main._archived_log_cache.clear()
+        yield
+        main._archived_log_cache.clear()
+
+    def write_log(self, path, content):
+        """Write an archived log file and return its path as a string."""
+        path.write_text(content)
+        return str(path)
+
+    def load(self, log_file, source_fields):
+        """Load an archived log file through the cache."""
+        return main._get_archived_log_entries(log_file, os.stat(log_file), source_fields)
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path):
+        """Test that a second read of an unchanged file returns the cached, sorted entries."""
+        log_file = self.write_log(tmp_path / "app.log", "2024-01-01T00:00:02Z second\n2024-01-01T00:00:01Z first\n")
+
+        record = self.load(log_file, {"pod_name": "pod-1"})
+
+        assert [entry["message"] for entry in record["entries"]] == ["first", "second"]
+        assert self.load(log_file, {"pod_name": "pod-1"}) is record
+
+    def test_rewritten_file_replaces_cache_entry(self, tmp_path):
+        """Test that a change in size or mtime re-reads the file and drops the stale entry."""
+        log_file = self.write_log(tmp_path / "app.log", "2024-01-01T00:00:01Z first\n")
+        self.load(log_file, {"pod_name": "pod-1"})
+
+        self.write_log(tmp_path / "app.log", "2024-01-01T00:00:01Z first\n2024-01-01T00:00:02Z second\n")
+        record = self.load(log_file, {"pod_name": "pod-1"})
+
+        assert len(record["entries"]) == 2
+        assert len(main._archived_log_cache) == 1
+
+    def test_least_recently_used_file_is_evicted(self, tmp_path, monkeypatch):
+        """Test that the cache is bounded by ARCHIVED_LOG_CACHE_MAX_FILES."""
+        monkeypatch.setattr(main, "ARCHIVED_LOG_CACHE_MAX_FILES", 2)
+        files = [self.write_log(tmp_path / f"{name}.log", f"2024-01-01T00:00:01Z {name}\n") for name in "abc"]
+
+        self.load(files[0], {"pod_name": "a"})
+        self.load(files[1], {"pod_name": "b"})
+        self.load(files[0], {"pod_name": "a"})
+        self.load(files[2], {"pod_name": "c"})
+
+        assert sorted(key[0] for key in main._archived_log_cache) == [files[0], files[2]]
+
+    def test_budget_counts_estimated_memory(self, tmp_path, monkeypatch):
+        """Test that files are budgeted by their parsed size, so a file within the on-disk budget can be skipped."""
+        log_file = self.write_log(tmp_path / "app.log", "2024-01-01T00:00:01Z first\n")
+        monkeypatch.setattr(main, "ARCHIVED_LOG_CACHE_MAX_BYTES", main.ARCHIVED_ENTRY_OVERHEAD_BYTES)
+
+        record = self.load(log_file, {"pod_name": "pod-1"})
+
+        assert record["cost"] > main.ARCHIVED_LOG_CACHE_MAX_BYTES
+        assert len(main._archived_log_cache) == 0
+
+    def test_case_insensitive_search_folds_like_live_search(self, tmp_path, monkeypatch):
+        """Test that searching cached entries agrees with build_search_matcher on non-ASCII case folding."""
+        self.write_log(tmp_path / "pod-1.log", "2024-01-01T00:00:01Z \u017fpace left\n")  # LATIN SMALL LETTER LONG S
+        monkeypatch.setattr(main, "LOG_DIR", str(tmp_path))
+        monkeypatch.setattr(main, "RETAIN_ALL_POD_LOGS", True)
+        monkeypatch.delenv("API_KEY", raising=False)
+
+        response = main.app.test_client().get("/api/archived_logs?pod_name=pod-1&search_string=SPACE")
+
+        assert [log["message"] for log in response.get_json()["logs"]] == ["\u017fpace left"]
+        assert main.build_search_matcher("SPACE", False)("\u017fpace left")
+        assert len(main._archived_log_cache) == 1
+
+
+class TestArchivedLogScan:
+    """Test the streaming scan used for large archived log files."""
+
+    CONTENT = (
+        "2024-01-01T00:00:02Z ERROR disk full\n"
+        "2024-01-01T00:00:01Z \x1b[31mERR\x1b[0mOR colored\n"
+        "2024-01-01T00:00:03Z info ok\r\n"
+        "no timestamp error\n"
+        "2024-01-01T00:00:04Z Ünïcode ERROR\n"
+    )
+
+    def scan(self, tmp_path, search_string, case_sensitive, sort_order, tail_lines):
+        """Scan CONTENT written to a temporary file and return the resulting messages."""
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(self.CONTENT.encode("utf-8"))
+        logs = main._scan_archived_log_file(
+            str(log_file), {"pod_name": "pod-1"}, search_string, case_sensitive, sort_order, tail_lines
+        )
+        return [log["message"] for log in logs]
+
+    def test_search_finds_matches_split_by_ansi_codes(self, tmp_path):
+        """Test that the raw-byte prefilter does not drop lines that only match once ANSI codes are removed."""
+        messages = self.scan(tmp_path, "ERROR", True, "asc", None)
+
+        assert messages == ["ERROR colored", "ERROR disk full", "Ünïcode ERROR"]
+
+    def test_case_insensitive_search_with_tail(self, tmp_path):
+        """Test case-insensitive search combined with sorting and tail limiting."""
+        messages = self.scan(tmp_path, "error", False, "desc", 2)
+
+        assert messages == ["Ünïcode ERROR", "ERROR disk full"]
+
+    def test_case_insensitive_search_folds_like_live_search(self, tmp_path):
+        """Test that non-ASCII case folding agrees with build_search_matcher, which lower() alone does not."""
+        self.CONTENT += "2024-01-01T00:00:05Z \u017fpace left\n"  # LATIN SMALL LETTER LONG S
+
+        assert self.scan(tmp_path, "SPACE", False, "asc", None) == ["\u017fpace left"]
+        assert main.build_search_matcher("SPACE", False)("\u017fpace left")
+
+    def test_tail_without_search(self, tmp_path):
+        """Test that tail limiting keeps the newest entries in ascending order."""
+        assert self.scan(tmp_path, "", False, "asc", 2) == ["info ok", "Ünïcode ERROR"]
+
+    def test_prefilter_disabled_for_truncation_marker(self):
+        """Test that searches which can match the truncation marker do not use the raw-byte prefilter."""
+        assert main._archived_search_prefilter("truncated", False) is None
+        assert main._archived_search_prefilter("timeout [", True) is None
+        assert main._archived_search_prefilter("timeout", True) is not None
+
+
+class TestArchivedFilesCache:
+    """Test the cached listing of archived log files."""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        """Point LOG_DIR at a temporary archive with two pods and start from an empty listing cache."""
+        for name in ("pod-a/app.log", "pod-b/app.log"):
+            (tmp_path / name).parent.mkdir(exist_ok=True)
+            (tmp_path / name).write_text("2024-01-01T00:00:01Z line\n")
+        monkeypatch.setattr(main, "LOG_DIR", str(tmp_path))
+        monkeypatch.setattr(main, "RETAIN_ALL_POD_LOGS", True)
+        monkeypatch.setattr(main, "ALLOW_PREVIOUS_LOG_PURGE", True)
+        monkeypatch.delenv("API_KEY", raising=False)
+        main._clear_archived_files_cache()
+        yield tmp_path
+        main._clear_archived_files_cache()
+
+    def test_listing_is_cached(self, log_dir):
+        """Test that a file added inside an existing pod directory is not listed until the cache expires."""
+        assert sorted(main._list_archived_log_files()) == ["pod-a/app", "pod-b/app"]
+
+        (log_dir / "pod-a" / "sidecar.log").write_text("")
+
+        assert sorted(main._list_archived_log_files()) == ["pod-a/app", "pod-b/app"]
+
+    def test_purge_clears_the_listing(self, log_dir, monkeypatch):
+        """Test that purged files disappear from the listing right away, although LOG_DIR's mtime is unchanged."""
+        assert sorted(main._list_archived_log_files()) == ["pod-a/app", "pod-b/app"]
+
+        def purge(path, logger):
+            """Delete pod-b's log the way the archiver's purge does, leaving its directory in place."""
+            os.remove(os.path.join(path, "pod-b", "app.log"))
+            return 1, 0
+
+        monkeypatch.setattr("log_archiver.purge_previous_pod_logs", purge)
+        response = main.app.test_client().post("/api/purgePreviousLogs")
+
+        assert response.get_json()["deleted_count"] == 1
+        assert main._list_archived_log_files() == ["pod-a/app"]
+
+    def test_download_all_names_the_zip_after_its_files(self, log_dir):
+        """Test that the download name counts the files written to the zip."""
+        (log_dir / "pod-a" / "notes.txt").write_text("")
+
+        response = main.app.test_client().get("/api/download_all_logs")
+
+        assert response.status_code == 200
+        assert "logpilot_logs_2files_" in response.headers["Content-Disposition"]
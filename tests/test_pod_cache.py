@@ -0,0 +1,78 @@
+"""
+Unit tests for the watch-maintained pod cache.
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import main
+
+    PodCache = main.PodCache
+except ImportError as e:
+    pytest.skip(f"Could not import main module: {e}", allow_module_level=True)
+
+
+def make_container(name):
+    """Build a V1Container-like mock (Mock reserves the ``name`` keyword)."""
+    container = Mock()
+    container.name = name
+    return container
+
+
+def make_pod(name, containers, init_containers=None):
+    """Build a minimal V1Pod-like mock."""
+    pod = Mock()
+    pod.metadata.name = name
+    pod.spec.containers = [make_container(c) for c in containers]
+    pod.spec.init_containers = [make_container(c) for c in (init_containers or [])]
+    return pod
+
+
+class TestPodCache:
+    """Test the pod cache list and event handling."""
+
+    def test_relist_populates_cache(self):
+        """Test that a relist replaces the cache contents and marks it synced."""
+        v1 = Mock()
+        v1.list_namespaced_pod.return_value = Mock(
+            items=[make_pod("app-1", ["app"], ["setup"]), make_pod("db-1", ["db"])],
+            metadata=Mock(resource_version="42"),
+        )
+        cache = PodCache(v1, "default", Mock())
+
+        assert not cache.is_synced()
+        assert cache._relist() == "42"
+        assert cache.is_synced()
+        v1.list_namespaced_pod.assert_called_once_with(namespace="default", resource_version="0")
+        assert sorted(cache.snapshot_pod_names()) == ["app-1", "db-1"]
+        assert ("app-1", ["app"], ["setup"]) in cache.snapshot_containers()
+
+    def test_watch_events_update_cache(self):
+        """Test that ADDED, MODIFIED and DELETED events are applied to the cache."""
+        cache = PodCache(Mock(), "default", Mock())
+
+        cache._apply_event("ADDED", make_pod("app-1", ["app"]))
+        cache._apply_event("ADDED", make_pod("app-2", ["app"]))
+        cache._apply_event("MODIFIED", make_pod("app-1", ["app", "sidecar"]))
+        cache._apply_event("DELETED", make_pod("app-2", ["app"]))
+
+        assert cache.snapshot_pod_names() == ["app-1"]
+        assert cache.snapshot_containers() == [("app-1", ["app", "sidecar"], [])]
+
+    def test_failed_relist_clears_synced(self):
+        """Test that a failing relist marks the cache as not synced so callers stop trusting it."""
+        v1 = Mock()
+        v1.list_namespaced_pod.return_value = Mock(items=[], metadata=Mock(resource_version="1"))
+        cache = PodCache(v1, "default", Mock())
+        cache._relist()
+        v1.list_namespaced_pod.side_effect = main.ApiException(status=503, reason="Service Unavailable")
+
+        with pytest.raises(main.ApiException):
+            cache._relist()
+        assert not cache.is_synced()